@@ -7,6 +7,7 @@ parsing.
 
 from __future__ import annotations
 
+import random
 import time
 from urllib.error import HTTPError
 
@@ -16,8 +17,19 @@ from pmcgrab.parser import paper_dict_from_pmc
 __all__: list[str] = ["build_paper_from_pmc"]
 
 
-# NOTE: retry / back-off logic kept identical to the original implementation to
-# preserve existing behaviour.
+_RETRY_BASE_DELAY = 1.0
+_RETRY_MAX_DELAY = 16.0
+
+
+def _retry_delay(retry: int) -> float:
+    """Return the jittered back-off delay in seconds for *retry* (0-based).
+
+    The ceiling doubles per retry (1, 2, 4 ... capped at 16 seconds) and
+    the actual delay is drawn from its upper half so concurrent workers do
+    not retry in lockstep.
+    """
+    ceiling = min(_RETRY_BASE_DELAY * 2**retry, _RETRY_MAX_DELAY)
+    return random.uniform(ceiling / 2, ceiling)
 
 
 def build_paper_from_pmc(
@@ -75,10 +87,13 @@ def build_paper_from_pmc(
     Note:
         This function mirrors the legacy Paper.from_pmc() API to enable
         easy migration while providing cleaner separation of concerns.
-        Network failures trigger automatic retries with 5-second delays.
+        Network failures trigger automatic retries with jittered exponential
+        back-off; no delay follows the final attempt.
     """
     d: dict | None = None
-    for _ in range(attempts):
+    for attempt in range(attempts):
+        if attempt:
+            time.sleep(_retry_delay(attempt - 1))
         try:
             d = paper_dict_from_pmc(
                 pmcid,
@@ -91,7 +106,7 @@ def build_paper_from_pmc(
             )
             break
         except HTTPError:
-            time.sleep(5)
+            continue
 
     if not d:
         return None
@@ -46,6 +46,7 @@ import warnings
 
 import lxml.etree as ET
 
+from pmcgrab.common.xml_processing import text_content
 from pmcgrab.constants import (
     UnexpectedMultipleMatchWarning,
     UnexpectedZeroMatchWarning,
@@ -202,9 +203,7 @@ def gather_funding(root: ET.Element) -> list[dict[str, str]] | None:
     # Capture funding-statement as well
     statements = root.xpath("//article-meta/funding-group/funding-statement")
     if statements:
-        statement_text = " ".join(
-            "".join(s.itertext()).strip() for s in statements
-        ).strip()
+        statement_text = " ".join(text_content(s) for s in statements).strip()
         if statement_text and not fund:
             fund.append(
                 {
@@ -42,6 +42,7 @@ import warnings
 import lxml.etree as ET
 import pandas as pd
 
+from pmcgrab.common.xml_processing import text_content
 from pmcgrab.constants import UnexpectedMultipleMatchWarning, UnexpectedZeroMatchWarning
 
 __all__: list[str] = [
@@ -139,7 +140,7 @@ def extract_contributor_info(
             institutions = []
             for inst_el in aff_el.xpath(".//institution"):
                 content_type = inst_el.get("content-type", "")
-                inst_text = "".join(inst_el.itertext()).strip()
+                inst_text = text_content(inst_el)
                 if inst_text:
                     institutions.append({"type": content_type, "name": inst_text})
 
@@ -173,11 +174,11 @@ def extract_contributor_info(
                 if inst_ids:
                     aff_dict["institution_ids"] = inst_ids
                 # Also include a flat text fallback
-                aff_dict["text"] = "".join(aff_el.itertext()).strip()
+                aff_dict["text"] = text_content(aff_el)
                 affils.append(aff_dict)
             else:
                 # Fallback: plain text
-                full_text = "".join(aff_el.itertext()).strip()
+                full_text = text_content(aff_el)
                 if len(aff_els) > 1:
                     warnings.warn(
                         "Multiple affiliations found for one ID.",
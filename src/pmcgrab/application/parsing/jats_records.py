@@ -14,6 +14,8 @@ from typing import Any
 
 import lxml.etree as ET
 
+from pmcgrab.common.xml_processing import text_content
+
 _XML_NS = "http://www.w3.org/XML/1998/namespace"
 _XLINK_NS = "http://www.w3.org/1999/xlink"
 _MATHML_NS = "http://www.w3.org/1998/Math/MathML"
@@ -795,7 +797,7 @@ class _JatsRecordBuilder:
             **identity,
             "type": block_type.replace("-", "_"),
             "language": element.get("language") or element.get("content-type") or "",
-            "text": "".join(element.itertext()).strip(),
+            "text": text_content(element),
             "source": self._source(element, ordinal=ordinal),
             "parse_status": "parsed",
         }
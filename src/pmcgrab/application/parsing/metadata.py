@@ -53,6 +53,7 @@ import warnings
 
 import lxml.etree as ET
 
+from pmcgrab.common.xml_processing import text_content
 from pmcgrab.constants import UnexpectedMultipleMatchWarning, UnexpectedZeroMatchWarning
 
 __all__: list[str] = [
@@ -137,7 +138,7 @@ def gather_title(root: ET.Element) -> str | None:
         return None
     # Use itertext() to capture all text content including inline markup
     # e.g. <article-title>Gene <italic>BRCA1</italic> and cancer</article-title>
-    return "".join(title_elems[0].itertext()).strip() or None
+    return text_content(title_elems[0]) or None
 
 
 # ---------------------------------------------------------------------------
@@ -42,6 +42,7 @@ import warnings
 
 import lxml.etree as ET
 
+from pmcgrab.common.xml_processing import text_content
 from pmcgrab.constants import (
     UnexpectedMultipleMatchWarning,
     UnexpectedZeroMatchWarning,
@@ -121,17 +122,13 @@ def _collect_sections(
         elif child.tag == "p":
             sections.append(TextParagraph(child, ref_map=ref_map))
         elif child.tag == "title":
-            text = "".join(child.itertext()).strip()
+            text = text_content(child)
             if text:
-                synth = ET.Element("p")
-                synth.text = text
-                sections.append(TextParagraph(synth, ref_map=ref_map))
+                sections.append(TextParagraph.from_text(text, ref_map=ref_map))
         elif child.tag in _BLOCK_AS_PARAGRAPH_TAGS:
             text = _render_block_element(child)
             if text and text.strip():
-                synth = ET.Element("p")
-                synth.text = text
-                sections.append(TextParagraph(synth, ref_map=ref_map))
+                sections.append(TextParagraph.from_text(text, ref_map=ref_map))
         else:
             warnings.warn(
                 f"Unexpected tag {child.tag} in {context}.",
@@ -45,6 +45,7 @@ XML Processing Module:
     Specialized functions for PMC XML content processing:
 
     * `stringify_children()`: Extract text content from XML elements
+    * `text_content()`: Extract plain descendant text from XML elements
     * `split_text_and_refs()`: Separate text from cross-references
     * `generate_typed_mhtml_tag()`: Create internal markup tags
     * `remove_mhtml_tags()`: Clean internal markup from processed text
@@ -94,6 +95,7 @@ from pmcgrab.common.xml_processing import (
     remove_mhtml_tags,
     split_text_and_refs,
     stringify_children,
+    text_content,
 )
 
 __all__: list[str] = [
@@ -105,4 +107,5 @@ __all__: list[str] = [
     "split_text_and_refs",
     "stringify_children",
     "strip_html_text_styling",
+    "text_content",
 ]
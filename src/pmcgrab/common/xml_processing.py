@@ -26,9 +26,13 @@ Use Cases:
 
 Functions:
     stringify_children: Extract complete text content from XML elements
+    text_content: Extract the plain text of an element and its descendants
     split_text_and_refs: Process text and extract cross-references
     generate_typed_mhtml_tag: Create internal placeholder tags
     remove_mhtml_tags: Clean up internal placeholder tags
+
+Constants:
+    REMOTE_PARSE_OPTIONS: Hardened lxml parser options for service responses
 """
 
 from __future__ import annotations
@@ -43,13 +47,27 @@ from pmcgrab.constants import logger
 from pmcgrab.domain.value_objects import BasicBiMap
 
 __all__: list[str] = [
+    "REMOTE_PARSE_OPTIONS",
     "generate_typed_mhtml_tag",
     "remove_mhtml_tags",
     "split_text_and_refs",
     "stringify_children",
+    "text_content",
 ]
 
 
+# Parser settings for XML returned by NCBI web services (OAI-PMH, OA
+# service): large harvest pages may exceed libxml2's default size limits,
+# xml:id lookups are never used, and entities are neither expanded nor
+# fetched over the network, whatever the installed lxml version defaults to.
+REMOTE_PARSE_OPTIONS: dict[str, bool] = {
+    "huge_tree": True,
+    "collect_ids": False,
+    "resolve_entities": False,
+    "no_network": True,
+}
+
+
 def stringify_children(node: ET.Element, *, encoding: str = "utf-8") -> str:
     """Extract complete text content from XML element including all child markup.
 
@@ -110,6 +128,32 @@ def stringify_children(node: ET.Element, *, encoding: str = "utf-8") -> str:
     return "".join(decoded).strip()
 
 
+def text_content(node: ET.Element) -> str:
+    """Return the stripped plain text of an XML element and its descendants.
+
+    Equivalent to ``"".join(node.itertext()).strip()``, but the text nodes are
+    concatenated by lxml's C-level ``text`` serialiser rather than a Python
+    generator and join. ``lxml.etree`` elements have no ``text_content()``
+    (that method only exists on ``lxml.html`` elements), so this fills the
+    same role. Tail text of *node* itself is excluded.
+
+    Args:
+        node: XML element to extract text from
+
+    Returns:
+        str: All descendant text concatenated, with surrounding whitespace
+             stripped
+
+    Examples:
+        >>> elem = ET.fromstring("<title> Results <italic>in vivo</italic> </title>")
+        >>> text_content(elem)
+        'Results in vivo'
+    """
+    return str(
+        ET.tostring(node, method="text", encoding="unicode", with_tail=False)
+    ).strip()
+
+
 # Tags that are tracked in the reference map (xref, fig, table-wrap) or
 # whose content should be kept inline without warnings.
 _ALLOWED_TAGS = {
@@ -137,11 +181,19 @@ _ALLOWED_TAGS = {
     "bold",
     "underline",
 }
+# Allowed tags that generate a ref-map entry (cross-references / floats).
+_REF_MAP_TAGS = frozenset(
+    {"xref", "fig", "table-wrap", "supplementary-material", "media"}
+)
 _TAG_PATTERN = re.compile(
     r"<([a-zA-Z][\w-]*)\b[^>]*(?<!/)>(.*?)</\1>|<([a-zA-Z][\w-]*)\b[^/>]*/?>",
     re.DOTALL,
 )
 
+_MHTML_TAG_PATTERN = re.compile(
+    r"\[MHTML::([^:\[\]]+)::([^:\[\]]+)\]|\[MHTML::([^:\[\]]+)\]"
+)
+
 
 def generate_typed_mhtml_tag(tag_type: str, value: str) -> str:
     """Generate internal placeholder tag for deferred processing.
@@ -267,17 +319,16 @@ def split_text_and_refs(
     text = strip_html_text_styling(text)
 
     cleaned: list[str] = []
-    while text:
-        match = _TAG_PATTERN.search(text)
-        if not match:
-            cleaned.append(text)
-            break
-
+    # Walk the matches with finditer instead of slicing off the consumed
+    # prefix after every tag, which copied the remaining text once per tag.
+    pos = 0
+    for match in _TAG_PATTERN.finditer(text):
         tag_name = match.group(1) or match.group(3)
         tag_contents = match.group(2) or ""
         full_tag = match.group()
 
-        cleaned.append(text[: match.start()])
+        cleaned.append(text[pos : match.start()])
+        pos = match.end()
 
         if tag_name not in _ALLOWED_TAGS:
             logger.debug(
@@ -285,13 +336,9 @@ def split_text_and_refs(
             )
             if on_unknown == "keep":
                 cleaned.append(tag_contents)
-            text = text[match.end() :]
             continue
 
         # Allowed tags -----------------------------------------------------
-        # Tags that generate a ref-map entry (cross-references / floats)
-        _REF_MAP_TAGS = {"xref", "fig", "table-wrap", "supplementary-material", "media"}
-
         if tag_name in _REF_MAP_TAGS:
             if tag_name == "xref":
                 cleaned.append(tag_contents)  # Inline citation text
@@ -307,7 +354,7 @@ def split_text_and_refs(
             # Inline content tags -- just keep the text content
             cleaned.append(tag_contents)
 
-        text = text[match.end() :]
+    cleaned.append(text[pos:])
 
     return "".join(cleaned)
 
@@ -363,5 +410,7 @@ def remove_mhtml_tags(text: str) -> str:
         If you need selective removal, process the placeholders individually
         before using this function for final cleanup.
     """
-    pat = r"\[MHTML::([^:\[\]]+)::([^:\[\]]+)\]|\[MHTML::([^:\[\]]+)\]"
-    return re.sub(pat, "", text)
+    # Most text carries no placeholders; skip the regex pass entirely.
+    if "[MHTML::" not in text:
+        return text
+    return _MHTML_TAG_PATTERN.sub("", text)
@@ -15,6 +15,7 @@ Classes:
 
 import lxml.etree as ET
 
+from pmcgrab.common.xml_processing import text_content
 from pmcgrab.domain.value_objects import BasicBiMap
 
 
@@ -91,10 +92,8 @@ class TextFigure:
         caption_el = fig_root.find(".//caption")
         graphic_el = fig_root.find(".//graphic")
 
-        label = "".join(label_el.itertext()).strip() if label_el is not None else None
-        caption = (
-            "".join(caption_el.itertext()).strip() if caption_el is not None else None
-        )
+        label = text_content(label_el) if label_el is not None else None
+        caption = text_content(caption_el) if caption_el is not None else None
 
         graphic_href: str | None = None
         if graphic_el is not None:
@@ -102,21 +101,13 @@ class TextFigure:
 
         # --- Extended metadata ---
         alt_text_el = fig_root.find(".//alt-text")
-        alt_text = (
-            "".join(alt_text_el.itertext()).strip() if alt_text_el is not None else None
-        )
+        alt_text = text_content(alt_text_el) if alt_text_el is not None else None
 
         long_desc_el = fig_root.find(".//long-desc")
-        long_desc = (
-            "".join(long_desc_el.itertext()).strip()
-            if long_desc_el is not None
-            else None
-        )
+        long_desc = text_content(long_desc_el) if long_desc_el is not None else None
 
         attrib_el = fig_root.find(".//attrib")
-        attrib = (
-            "".join(attrib_el.itertext()).strip() if attrib_el is not None else None
-        )
+        attrib = text_content(attrib_el) if attrib_el is not None else None
 
         # Figure-specific copyright/permissions
         fig_permissions: dict[str, str] | None = None
@@ -25,9 +25,11 @@ from __future__ import annotations
 
 import threading
 import time
+from collections.abc import Callable
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from pmcgrab.infrastructure.settings import PMCGRAB_SSL_VERIFY
 
@@ -38,6 +40,13 @@ __all__ = [
 # Module-level session for connection pooling (HTTP keep-alive)
 _session = requests.Session()
 _session.headers.update({"User-Agent": "pmcgrab"})
+# requests keeps at most 10 idle connections per host by default, fewer than
+# the 16 worker threads batch processing uses, so extra sockets were closed
+# after every request and later ones paid a fresh TCP/TLS handshake. Retries
+# stay in cached_get, which already backs off between attempts.
+_adapter = HTTPAdapter(pool_connections=16, pool_maxsize=64)
+_session.mount("https://", _adapter)
+_session.mount("http://", _adapter)
 if not PMCGRAB_SSL_VERIFY:
     _session.verify = False
 
@@ -64,7 +73,12 @@ def _backoff_sleep(retry: int) -> None:
 
 
 def cached_get(
-    url: str, params: dict[str, Any] | None = None, **kwargs: Any
+    url: str,
+    params: dict[str, Any] | None = None,
+    *,
+    cache: bool = True,
+    throttle: Callable[[], None] | None = None,
+    **kwargs: Any,
 ) -> requests.Response:
     """HTTP GET request with automatic retry logic and in-memory caching.
 
@@ -75,6 +89,11 @@ def cached_get(
     Args:
         url: Target URL for the GET request
         params: Optional query parameters as key-value pairs
+        cache: If False, neither read nor store the in-memory cache. Use this
+               for one-off or streamed (``stream=True``) responses whose body
+               must not be kept for the lifetime of the process.
+        throttle: Optional callable (e.g. a rate limiter's wait) invoked
+                  before every network attempt. Cache hits skip it.
         **kwargs: Additional keyword arguments passed to requests.get()
                  (headers, timeout, auth, etc.)
 
@@ -128,19 +147,23 @@ def cached_get(
     else:
         key = url
 
-    with _cache_lock:
-        if key in _CACHE:
-            return _CACHE[key]
+    if cache:
+        with _cache_lock:
+            if key in _CACHE:
+                return _CACHE[key]
 
     for retry in range(5):
         try:
             # Use the module-level session for connection pooling
             kw = dict(kwargs)
             kw.setdefault("timeout", 30)
+            if throttle is not None:
+                throttle()
             resp = _session.get(url, params=params, **kw)
             resp.raise_for_status()
-            with _cache_lock:
-                _CACHE[key] = resp
+            if cache:
+                with _cache_lock:
+                    _CACHE[key] = resp
             return resp
         except requests.RequestException:
             if retry == 4:
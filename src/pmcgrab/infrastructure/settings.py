@@ -19,6 +19,8 @@ Key Features:
 Environment Variables:
     PMCGRAB_EMAILS: Comma-separated list of email addresses for NCBI Entrez
                    Example: "user1@example.com,user2@example.com"
+    PMCGRAB_OAI_RPS: Maximum OAI-PMH requests per second (default: 3, or
+                   10 when ``NCBI_API_KEY`` is set)
 
 Default Behavior:
     If no environment override is provided, uses the package maintainer contact.
@@ -48,8 +50,10 @@ __all__: list[str] = [
     "NCBI_RETRIES",
     "NCBI_TIMEOUT",
     "PMCGRAB_MAX_ASSET_BYTES",
+    "PMCGRAB_OAI_RPS",
     "PMCGRAB_SSL_VERIFY",
     "next_email",
+    "oai_rate_limit_wait",
     "rate_limit_wait",
 ]
 
@@ -148,3 +152,32 @@ _limiter = _RateLimiter(_rate)
 def rate_limit_wait() -> None:
     """Block until the next NCBI API call is allowed by the rate limiter."""
     _limiter.wait()
+
+
+# ---------------------------------------------------------------------------
+# Separate rate limiter for the OAI-PMH service
+# ---------------------------------------------------------------------------
+
+
+def _env_rate(name: str, default: float) -> float:
+    """Read a requests-per-second value from *name*, falling back to *default*.
+
+    Unset, non-numeric and non-positive values all yield *default*, so a bad
+    override cannot break the import.
+    """
+    try:
+        rate = float(os.getenv(name, ""))
+    except ValueError:
+        return default
+    return rate if rate > 0 else default
+
+
+# The OAI-PMH service is throttled separately from E-utilities, so harvests
+# get their own limiter; bursts would otherwise be answered with 429s.
+PMCGRAB_OAI_RPS: float = _env_rate("PMCGRAB_OAI_RPS", _rate)
+_oai_limiter = _RateLimiter(PMCGRAB_OAI_RPS)
+
+
+def oai_rate_limit_wait() -> None:
+    """Block until the next OAI-PMH request is allowed by the rate limiter."""
+    _oai_limiter.wait()
@@ -20,23 +20,33 @@ extraction alongside metadata.
 import copy
 import datetime
 import json
-import textwrap
+import re
+import sys
 import warnings
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from io import StringIO
 from pathlib import Path
+from typing import Any
 
 import lxml.etree as ET
 import pandas as pd
+from pandas.io.parsers import TextParser
 
 from pmcgrab.common.xml_processing import (
     remove_mhtml_tags,
     split_text_and_refs,
     stringify_children,
+    text_content,
 )
 from pmcgrab.constants import MultipleTitleWarning, ReadHTMLFailure
 from pmcgrab.domain.value_objects import BasicBiMap
 from pmcgrab.figure import TextFigure
 from pmcgrab.utils import define_data_dict
 
+# Python 3.10 compatibility: datetime.UTC was added later than 3.10.
+_UTC = getattr(datetime, "UTC", datetime.timezone.utc)
+
 
 class Paper:
     """Comprehensive container for all parsed information about a PMC article.
@@ -133,9 +143,7 @@ class Paper:
             self.has_data = False
             return
         self.has_data = True
-        # Python 3.10 compatibility: datetime.UTC was added later than 3.10.
-        _utc = getattr(datetime, "UTC", datetime.timezone.utc)
-        self.last_updated = datetime.datetime.now(_utc).isoformat()
+        self.last_updated = datetime.datetime.now(_UTC).isoformat()
         self.pmcid = d.get("PMCID")
         self.title = d.get("Title")
         self.authors = d.get("Authors")
@@ -262,6 +270,48 @@ class Paper:
         )
         return cls(d)
 
+    @classmethod
+    def from_pmcs(
+        cls,
+        pmcids: Iterable[str | int],
+        *,
+        email: str | None = None,
+        max_workers: int = 16,
+        **kwargs: bool,
+    ) -> list["Paper"]:
+        """Create Papers for several PMC articles using a thread pool.
+
+        Downloads overlap across worker threads while each request still
+        passes through the shared NCBI rate limiter used by
+        :meth:`from_pmc`, so the 3 (or 10 with an API key) requests per
+        second ceiling is respected regardless of ``max_workers``.
+
+        Args:
+            pmcids: PubMed Central IDs in any form accepted by :meth:`from_pmc`
+            email: Contact email for NCBI API. If None, uses the email pool.
+            max_workers: Maximum number of concurrent downloads
+            **kwargs: Keyword flags forwarded to :meth:`from_pmc`
+                (download, validate, verbose, suppress_warnings,
+                suppress_errors)
+
+        Returns:
+            list[Paper]: Parsed Papers in the same order as ``pmcids``
+
+        Raises:
+            Exception: The first error raised by :meth:`from_pmc`, in input
+                order, unless ``suppress_errors`` is set.
+
+        Examples:
+            >>> papers = Paper.from_pmcs(["7181753", "3539614"], max_workers=4)
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        def build(pmcid: str | int) -> "Paper":
+            return cls.from_pmc(pmcid, email=email, **kwargs)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(build, pmcids))
+
     @classmethod
     def from_local_xml(
         cls,
@@ -559,12 +609,12 @@ class Paper:
 
     @staticmethod
     def _collect_paragraphs(
-        elements: list,
+        elements: Sequence[Any],
         section_title: str | None,
         subsection_title: str | None,
         out: list[dict[str, str | int | None]],
     ) -> None:
-        """Recursively collect paragraphs from a list of text elements."""
+        """Recursively collect paragraphs from a sequence of text elements."""
         para_idx = 0
         for element in elements:
             if isinstance(element, TextSection):
@@ -654,7 +704,7 @@ class TextElement:
     the document structure.
 
     Attributes:
-        root (ET.Element): The XML element this text element wraps
+        root (Optional[ET.Element]): The XML element this text element wraps
         parent (Optional[TextElement]): Parent element in the hierarchy
         ref_map (BasicBiMap): Bidirectional reference mapping for cross-references
 
@@ -662,16 +712,19 @@ class TextElement:
     tables, figures) and their actual definitions elsewhere in the document.
     """
 
+    __slots__ = ("_ref_root", "parent", "ref_map", "root")
+
     def __init__(
         self,
-        root: ET.Element,
+        root: ET.Element | None,
         parent: "TextElement | None" = None,
         ref_map: BasicBiMap | None = None,
     ) -> None:
         """Initialize a text element with XML root and optional parent/reference map.
 
         Args:
-            root: The XML element that this text element represents
+            root: The XML element that this text element represents, or None
+                  for elements built from already-rendered text
             parent: Parent element in the document hierarchy (for reference inheritance)
             ref_map: Bidirectional reference map for cross-reference resolution.
                     If None, creates a new empty BasicBiMap.
@@ -679,6 +732,10 @@ class TextElement:
         self.root = root
         self.parent = parent
         self.ref_map = ref_map if ref_map is not None else BasicBiMap()
+        # The element at the top of the parent chain owns the shared ref map.
+        # It is resolved once here so lookups don't walk the chain each time;
+        # storing the element rather than its map keeps set_ref_map visible.
+        self._ref_root: TextElement = parent._ref_root if parent else self
 
     def get_ref_map(self) -> BasicBiMap:
         """Get the reference map, inheriting from parent if available.
@@ -688,7 +745,7 @@ class TextElement:
                        root parent. Enables consistent cross-reference resolution
                        throughout the document hierarchy.
         """
-        return self.parent.get_ref_map() if self.parent else self.ref_map
+        return self._ref_root.ref_map
 
     def set_ref_map(self, ref_map: BasicBiMap) -> None:
         """Set the reference map, propagating to root parent if present.
@@ -698,10 +755,7 @@ class TextElement:
                     Will be set on the root parent if hierarchy exists, otherwise
                     set directly on this element.
         """
-        if self.parent:
-            self.parent.set_ref_map(ref_map)
-        else:
-            self.ref_map = ref_map
+        self._ref_root.ref_map = ref_map
 
 
 class TextParagraph(TextElement):
@@ -728,6 +782,8 @@ class TextParagraph(TextElement):
         >>> print(str(paragraph))
     """
 
+    __slots__ = ("id", "text", "text_with_refs")
+
     def __init__(
         self,
         p_root: ET.Element,
@@ -750,6 +806,38 @@ class TextParagraph(TextElement):
         )
         self.text = remove_mhtml_tags(self.text_with_refs)
 
+    @classmethod
+    def from_text(
+        cls,
+        text: str,
+        parent: TextElement | None = None,
+        ref_map: BasicBiMap | None = None,
+    ) -> "TextParagraph":
+        """Build a paragraph from text that has already been rendered.
+
+        Used for block elements (lists, formulas, quotes, ...) and fallback
+        content that are flattened to plain text before becoming paragraphs.
+        Skips wrapping the text in a synthetic ``<p>`` element and the
+        deep-copy/stringify round trip that ``__init__`` performs on it; the
+        resulting paragraph has no backing XML element (``root`` is None).
+
+        Args:
+            text: Rendered paragraph text
+            parent: Parent text element for reference map inheritance
+            ref_map: Reference map for cross-reference resolution
+
+        Returns:
+            TextParagraph: Paragraph with ``text`` and ``text_with_refs`` set.
+        """
+        paragraph = cls.__new__(cls)
+        TextElement.__init__(paragraph, None, parent, ref_map)
+        paragraph.id = None
+        paragraph.text_with_refs = split_text_and_refs(
+            text, paragraph.get_ref_map(), on_unknown="keep"
+        )
+        paragraph.text = remove_mhtml_tags(paragraph.text_with_refs)
+        return paragraph
+
     def __str__(self) -> str:
         """Return clean paragraph text without reference tags.
 
@@ -768,11 +856,122 @@ class TextParagraph(TextElement):
         Returns:
             bool: True if other is a TextParagraph with identical text_with_refs
         """
+        if self is other:
+            return True
+        if not isinstance(other, TextParagraph):
+            return False
+        # str caches its hash, so repeated comparisons of different paragraphs
+        # (e.g. deduplication passes) are rejected without a full string compare.
         return (
-            isinstance(other, TextParagraph)
+            hash(self.text_with_refs) == hash(other.text_with_refs)
             and self.text_with_refs == other.text_with_refs
         )
 
+    def __hash__(self) -> int:
+        """Hash consistently with ``__eq__`` so paragraphs can be deduplicated.
+
+        Returns:
+            int: Hash of ``text_with_refs``
+        """
+        return hash(self.text_with_refs)
+
+
+_ORDERED_LIST_TYPES = frozenset(
+    {"order", "alpha-lower", "alpha-upper", "roman-lower", "roman-upper"}
+)
+
+
+def _render_list(elem: ET.Element) -> str:
+    """Render ``<list>`` items one per line, numbered for ordered list types."""
+    ordered = elem.get("list-type", "bullet") in _ORDERED_LIST_TYPES
+    items: list[str] = []
+    for idx, item in enumerate(elem.findall("list-item"), 1):
+        text = " ".join(item.itertext()).strip()
+        items.append(f"{idx}. {text}" if ordered else f"- {text}")
+    return "\n".join(items)
+
+
+def _render_def_list(elem: ET.Element) -> str:
+    """Render ``<def-list>`` items as ``term: definition`` lines."""
+    parts: list[str] = []
+    for def_item in elem.findall("def-item"):
+        term_el = def_item.find("term")
+        def_el = def_item.find("def")
+        term = text_content(term_el) if term_el is not None else ""
+        defn = text_content(def_el) if def_el is not None else ""
+        parts.append(f"{term}: {defn}")
+    return "\n".join(parts)
+
+
+def _render_formula(elem: ET.Element) -> str:
+    """Render a formula, preferring ``<tex-math>`` over MathML over plain text."""
+    tex = elem.find("tex-math")
+    if tex is not None and tex.text:
+        return str(tex.text).strip()
+    mml = elem.find("{http://www.w3.org/1998/Math/MathML}math")
+    if mml is not None:
+        return str(ET.tostring(mml, encoding="unicode"))
+    alt = elem.find("alternatives")
+    if alt is not None:
+        tex2 = alt.find("tex-math")
+        if tex2 is not None and tex2.text:
+            return str(tex2.text).strip()
+    return text_content(elem)
+
+
+def _render_disp_quote(elem: ET.Element) -> str:
+    """Render ``<disp-quote>`` as its text wrapped in double quotes."""
+    return f'"{text_content(elem)}"'
+
+
+def _render_boxed_text(elem: ET.Element) -> str:
+    """Render ``<boxed-text>`` paragraphs, prefixed by a bracketed title."""
+    title_el = elem.find("caption/title")
+    title = text_content(title_el) if title_el is not None else ""
+    body = "\n".join(text_content(p) for p in elem.findall(".//p"))
+    if title:
+        return f"[{title}] {body}"
+    return body
+
+
+def _render_verse_group(elem: ET.Element) -> str:
+    """Render ``<verse-group>`` with one verse line per output line."""
+    return "\n".join(text_content(vl) for vl in elem.findall("verse-line"))
+
+
+def _render_speech(elem: ET.Element) -> str:
+    """Render ``<speech>`` as ``speaker: text``."""
+    speaker_el = elem.find("speaker")
+    speaker = text_content(speaker_el) if speaker_el is not None else ""
+    speech = " ".join(text_content(p) for p in elem.findall("p"))
+    return f"{speaker}: {speech}" if speaker else speech
+
+
+def _render_statement(elem: ET.Element) -> str:
+    """Render ``<statement>`` text, making sure its title leads."""
+    title_el = elem.find("title")
+    title = text_content(title_el) if title_el is not None else ""
+    body_text = text_content(elem)
+    if title and body_text.startswith(title):
+        return body_text
+    # Both parts are already stripped, so join only the non-empty ones
+    return " ".join(part for part in (title, body_text) if part)
+
+
+# Tag -> renderer for block elements with dedicated formatting.  Anything not
+# listed here (including ``<preformat>``/``<code>``) renders as its flat text.
+_BLOCK_RENDERERS: dict[str, Callable[[ET.Element], str]] = {
+    "list": _render_list,
+    "def-list": _render_def_list,
+    "disp-formula": _render_formula,
+    "inline-formula": _render_formula,
+    "disp-quote": _render_disp_quote,
+    "boxed-text": _render_boxed_text,
+    "verse-group": _render_verse_group,
+    "speech": _render_speech,
+    "statement": _render_statement,
+}
+
 
 def _render_block_element(elem: ET.Element) -> str:
     """Render a JATS block-level element into readable plain text.
@@ -782,98 +981,11 @@ def _render_block_element(elem: ET.Element) -> str:
     ``<verse-group>``, ``<speech>``, ``<statement>``, and other block
     elements by converting them into a readable string representation.
     """
-    tag = elem.tag
-
-    if tag == "list":
-        items: list[str] = []
-        list_type = elem.get("list-type", "bullet")
-        for idx, item in enumerate(elem.findall("list-item"), 1):
-            text = " ".join(item.itertext()).strip()
-            if list_type in (
-                "order",
-                "alpha-lower",
-                "alpha-upper",
-                "roman-lower",
-                "roman-upper",
-            ):
-                items.append(f"{idx}. {text}")
-            else:
-                items.append(f"- {text}")
-        return "\n".join(items)
-
-    if tag == "def-list":
-        parts: list[str] = []
-        for def_item in elem.findall("def-item"):
-            term_el = def_item.find("term")
-            def_el = def_item.find("def")
-            term = "".join(term_el.itertext()).strip() if term_el is not None else ""
-            defn = "".join(def_el.itertext()).strip() if def_el is not None else ""
-            parts.append(f"{term}: {defn}")
-        return "\n".join(parts)
-
-    if tag in ("disp-formula", "inline-formula"):
-        # Prefer <tex-math>, fall back to <mml:math>, then itertext
-        tex = elem.find("tex-math")
-        if tex is not None and tex.text:
-            return str(tex.text).strip()
-        mml = elem.find("{http://www.w3.org/1998/Math/MathML}math")
-        if mml is not None:
-            return str(ET.tostring(mml, encoding="unicode"))
-        alt = elem.find("alternatives")
-        if alt is not None:
-            tex2 = alt.find("tex-math")
-            if tex2 is not None and tex2.text:
-                return str(tex2.text).strip()
-        return "".join(elem.itertext()).strip()
-
-    if tag == "disp-quote":
-        text = "".join(elem.itertext()).strip()
-        return f'"{text}"'
-
-    if tag == "boxed-text":
-        title_el = elem.find("caption/title")
-        title = "".join(title_el.itertext()).strip() if title_el is not None else ""
-        body_parts = []
-        for p in elem.findall(".//p"):
-            body_parts.append("".join(p.itertext()).strip())
-        body = "\n".join(body_parts)
-        if title:
-            return f"[{title}] {body}"
-        return body
-
-    if tag in ("preformat", "code"):
-        return "".join(elem.itertext()).strip()
-
-    if tag == "verse-group":
-        lines: list[str] = []
-        for vl in elem.findall("verse-line"):
-            lines.append("".join(vl.itertext()).strip())
-        return "\n".join(lines)
-
-    if tag == "speech":
-        speaker_el = elem.find("speaker")
-        speaker = (
-            "".join(speaker_el.itertext()).strip() if speaker_el is not None else ""
-        )
-        speech_parts = []
-        for p in elem.findall("p"):
-            speech_parts.append("".join(p.itertext()).strip())
-        return (
-            f"{speaker}: " + " ".join(speech_parts)
-            if speaker
-            else " ".join(speech_parts)
-        )
-
-    if tag == "statement":
-        title_el = elem.find("title")
-        title = "".join(title_el.itertext()).strip() if title_el is not None else ""
-        body_text = "".join(elem.itertext()).strip()
-        if title and body_text.startswith(title):
-            return body_text
-        return f"{title} {body_text}".strip()
-
-    # Generic fallback: join all text content
-    return "".join(elem.itertext()).strip()
+    renderer = _BLOCK_RENDERERS.get(elem.tag)
+    if renderer is None:
+        # Generic fallback (also covers <preformat> and <code>)
+        return text_content(elem)
+    return renderer(elem)
 
 
 _INLINE_BLOCK_TAGS = frozenset(
@@ -913,6 +1025,23 @@ _SECTION_BLOCK_AS_PARAGRAPH_TAGS = frozenset(
     }
 )
 
+# Indentation added per nesting level when a section is rendered to text.
+_SECTION_INDENT = " " * 4
+
+
+def _indent(text: str, prefix: str) -> str:
+    """Prefix every non-blank line of *text*, exactly like ``textwrap.indent``.
+
+    Inlines the stdlib's per-line predicate and generator into a single list
+    comprehension.  A plain ``str.replace`` on newlines is not equivalent:
+    ``textwrap.indent`` leaves whitespace-only lines untouched and splits on
+    every ``str.splitlines`` boundary.
+    """
+    return "".join(
+        [prefix + line if line.strip() else line for line in text.splitlines(True)]
+    )
+
+
 _SECTION_SKIP_TAGS = frozenset(
     {
         "label",
@@ -935,14 +1064,19 @@ def _flatten_block_elements_in_paragraph(p_root: ET.Element) -> ET.Element:
 
     This function deep-copies the node so the original tree is never mutated,
     then replaces every nested block element with its rendered plain-text
-    equivalent by adjusting the surrounding ``text``/``tail`` strings.
+    equivalent by adjusting the surrounding ``text``/``tail`` strings.  Most
+    paragraphs contain no block elements; those are returned as-is without
+    the copy.
 
     Args:
         p_root: The ``<p>`` lxml element to process.
 
     Returns:
-        ET.Element: A deep copy of ``p_root`` with block elements replaced by text.
+        ET.Element: A deep copy of ``p_root`` with block elements replaced by
+        text, or ``p_root`` itself if it has no nested block elements.
     """
+    if next(p_root.iterdescendants(*_INLINE_BLOCK_TAGS), None) is None:
+        return p_root
     node = copy.deepcopy(p_root)
     for tag in _INLINE_BLOCK_TAGS:
         for block in node.findall(f".//{tag}"):
@@ -973,7 +1107,7 @@ class TextSection(TextElement):
 
     Attributes:
         title (Optional[str]): Section title/heading
-        children (list): Child elements including subsections, paragraphs, tables, figures
+        children (tuple): Child elements including subsections, paragraphs, tables, figures
         text (str): Complete section text with clean formatting
         text_with_refs (str): Complete section text with reference markers preserved
 
@@ -994,6 +1128,11 @@ class TextSection(TextElement):
         ...         print(f"Subsection: {child.title}")
     """
 
+    __slots__ = ("_struct_hash", "_text", "_text_with_refs", "children", "title")
+    _text: str | None
+    _text_with_refs: str | None
+    _struct_hash: int | None
+
     def __init__(
         self,
         sec_root: ET.Element,
@@ -1017,59 +1156,103 @@ class TextSection(TextElement):
         """
         super().__init__(sec_root, parent, ref_map)
         self.title: str | None = None
-        self.children: list[TextSection | TextParagraph | TextTable | TextFigure] = []
-
-        for child in sec_root:
-            if child.tag == "title":
-                if self.title:
-                    warnings.warn(
-                        "Multiple titles found; using the first.",
-                        MultipleTitleWarning,
-                        stacklevel=2,
-                    )
-                    continue
-                self.title = "".join(child.itertext()).strip() or None
-            elif child.tag == "sec":
-                self.children.append(
-                    TextSection(child, parent=self, ref_map=self.get_ref_map())
-                )
-            elif child.tag == "p":
-                self.children.append(
-                    TextParagraph(child, parent=self, ref_map=self.get_ref_map())
-                )
-            elif child.tag == "table-wrap":
-                self.children.append(
-                    TextTable(child, parent=self, ref_map=self.get_ref_map())
-                )
-            elif child.tag == "fig":
-                self.children.append(
-                    TextFigure(child, parent=self, ref_map=self.get_ref_map())
-                )
-            elif child.tag in _SECTION_BLOCK_AS_PARAGRAPH_TAGS:
-                # Render the entire block element as text so content is
-                # never silently dropped.  We create a synthetic <p>
-                # wrapper so it flows through the normal TextParagraph
-                # pipeline including reference extraction.
-                synth = ET.SubElement(ET.Element("_root"), "p")
-                synth.text = _render_block_element(child)
-                if synth.text and synth.text.strip():
-                    self.children.append(
-                        TextParagraph(synth, parent=self, ref_map=self.get_ref_map())
+        self.children: tuple[TextSection | TextParagraph | TextTable | TextFigure, ...]
+        self.children = ()
+
+        # Nested <sec> elements are built with an explicit stack rather than
+        # by recursing into TextSection(), so deeply nested supplements cannot
+        # hit the interpreter recursion limit.  Children are still visited in
+        # document order (the ref map indices depend on it) and each section
+        # is finalised post-order, once all of its subsections are done.
+        # Every section in the tree resolves to the same root ref map, so
+        # walk the parent chain once instead of once per child element.
+        # Comments and processing instructions are filtered out by lxml
+        # itself; they carry no section text.  Children are collected in a
+        # list while the section is open and frozen into a tuple when it
+        # closes, since they are never modified after construction.
+        ref_map = self.get_ref_map()
+        # The handler lookup and list append are bound outside the per-child
+        # loop, which runs once for every element in the body.
+        get_handler = _SECTION_CHILD_HANDLERS.get
+        fallback = TextSection._build_fallback
+        stack: deque[tuple[TextSection, Iterator[ET.Element], list]] = deque(
+            [(self, sec_root.iterchildren(ET.Element), [])]
+        )
+        while stack:
+            section, pending, children = stack[-1]
+            append = children.append
+            for child in pending:
+                tag = child.tag
+                if tag == "sec":
+                    subsection = TextSection.__new__(TextSection)
+                    TextElement.__init__(
+                        subsection, child, parent=section, ref_map=ref_map
                     )
-            elif child.tag in _SECTION_SKIP_TAGS:
-                pass  # structural metadata, not body text
+                    subsection.title = None
+                    subsection.children = ()
+                    append(subsection)
+                    stack.append((subsection, child.iterchildren(ET.Element), []))
+                    break
+                element = get_handler(tag, fallback)(section, child, ref_map)
+                if element is not None:
+                    append(element)
             else:
-                # Last resort: extract any text content so nothing is lost
-                fallback_text = "".join(child.itertext()).strip()
-                if fallback_text:
-                    synth = ET.SubElement(ET.Element("_root"), "p")
-                    synth.text = fallback_text
-                    self.children.append(
-                        TextParagraph(synth, parent=self, ref_map=self.get_ref_map())
-                    )
-
-        self.text = self.get_section_text()
-        self.text_with_refs = self.get_section_text_with_refs()
+                stack.pop()
+                section.children = tuple(children)
+                section._text = None
+                section._text_with_refs = None
+                section._struct_hash = section._structure_hash()
+
+    def _read_title(self, child: ET.Element, _ref_map: BasicBiMap) -> None:
+        """Set the section title from ``<title>``, warning on duplicates."""
+        if self.title:
+            warnings.warn(
+                "Multiple titles found; using the first.",
+                MultipleTitleWarning,
+                stacklevel=3,
+            )
+            return
+        title = text_content(child)
+        # Section headings ("Methods", "Results", ...) repeat across every
+        # article in a batch; interning keeps one copy of each.
+        self.title = sys.intern(title) if title else None
+
+    def _build_paragraph(self, child: ET.Element, ref_map: BasicBiMap) -> TextParagraph:
+        """Build the TextParagraph for a ``<p>`` child."""
+        return TextParagraph(child, parent=self, ref_map=ref_map)
+
+    def _build_table(self, child: ET.Element, ref_map: BasicBiMap) -> "TextTable":
+        """Build the TextTable for a ``<table-wrap>`` child."""
+        return TextTable(child, parent=self, ref_map=ref_map)
+
+    def _build_figure(self, child: ET.Element, ref_map: BasicBiMap) -> TextFigure:
+        """Build the TextFigure for a ``<fig>`` child."""
+        return TextFigure(child, parent=self, ref_map=ref_map)
+
+    def _build_block(
+        self, child: ET.Element, ref_map: BasicBiMap
+    ) -> TextParagraph | None:
+        """Build a TextParagraph from a block element rendered to text.
+
+        The rendered text still goes through reference extraction like any
+        other paragraph, so block content is never silently dropped.
+        """
+        text = _render_block_element(child)
+        if text and text.strip():
+            return TextParagraph.from_text(text, parent=self, ref_map=ref_map)
+        return None
+
+    def _skip_child(self, child: ET.Element, ref_map: BasicBiMap) -> None:
+        """Ignore structural metadata that is not body text."""
+
+    def _build_fallback(
+        self, child: ET.Element, ref_map: BasicBiMap
+    ) -> TextParagraph | None:
+        """Keep the text of an unrecognised child so nothing is lost."""
+        fallback_text = text_content(child)
+        if fallback_text:
+            return TextParagraph.from_text(fallback_text, parent=self, ref_map=ref_map)
+        return None
 
     def __str__(self) -> str:
         """Return human-readable representation of the section.
@@ -1077,13 +1260,53 @@ class TextSection(TextElement):
         Creates a formatted string showing the section title and all child
         content with proper indentation to reflect the hierarchical structure.
 
+        The text is rendered once and cached (see ``text``), so repeated
+        ``str()`` calls from the Paper helpers don't re-walk the subtree.
+
         Returns:
             str: Formatted section text with title header and indented children
         """
-        res = f"SECTION: {self.title}:\n" if self.title else ""
+        return self.text
+
+    def _render_text(self, parts: list[str], prefix: str, with_refs: bool) -> None:
+        """Append this section's formatted text to ``parts``.
+
+        Nested sections are rendered straight into ``parts`` with a longer
+        prefix rather than indenting their finished text at every ancestor,
+        so each leaf is indented once however deep it sits.  This gives the
+        same result as indenting every nested section's text at each level,
+        because indenting twice equals indenting once with the combined
+        prefix.
+
+        Args:
+            parts: Output buffer the formatted pieces are appended to
+            prefix: Indentation applied to every non-blank line of this section
+            with_refs: Use paragraph text with reference markers, skip tables
+                and leave the section's own paragraphs unindented
+        """
+        if self.title:
+            title = f"SECTION: {self.title}:\n"
+            parts.append(_indent(title, prefix) if prefix else title)
+        child_prefix = prefix + _SECTION_INDENT
+        # The with-refs view leaves a section's own paragraphs unindented.
+        leaf_prefix = prefix if with_refs else child_prefix
         for child in self.children:
-            res += "\n" + textwrap.indent(str(child), " " * 4) + "\n"
-        return res
+            if isinstance(child, TextSection):
+                parts.append("\n")
+                child._render_text(parts, child_prefix, with_refs)
+                parts.append("\n")
+                continue
+            if not with_refs:
+                text = str(child)
+            elif isinstance(child, TextParagraph):
+                text = child.text_with_refs
+            elif isinstance(child, TextFigure):
+                text = str(child)
+            else:
+                continue
+            if leaf_prefix:
+                text = _indent(text, leaf_prefix)
+            parts.extend(("\n", text, "\n"))
 
     def get_clean_text(self) -> str:
         """Return clean body text without 'SECTION:' prefixes or indentation.
@@ -1105,6 +1328,24 @@ class TextSection(TextElement):
                     parts.append(text)
         return "\n".join(parts)
 
+    @property
+    def text(self) -> str:
+        """Section text without reference markers, rendered on first access.
+
+        Rendering is deferred so that nested sections, and the tables they
+        contain, are only formatted when their text is actually read.
+        """
+        if self._text is None:
+            self._text = self.get_section_text()
+        return self._text
+
+    @property
+    def text_with_refs(self) -> str:
+        """Section text with reference markers, rendered on first access."""
+        if self._text_with_refs is None:
+            self._text_with_refs = self.get_section_text_with_refs()
+        return self._text_with_refs
+
     def get_section_text(self) -> str:
         """Return clean text for this section without reference markers.
 
@@ -1112,7 +1353,9 @@ class TextSection(TextElement):
             str: Complete section text with HTML tags and reference markers
                  removed, suitable for display or AI/ML processing.
         """
-        return str(self)
+        parts: list[str] = []
+        self._render_text(parts, "", with_refs=False)
+        return "".join(parts)
 
     def get_section_text_with_refs(self) -> str:
         """Return section text including cross-reference markers.
@@ -1124,19 +1367,9 @@ class TextSection(TextElement):
             str: Complete section text with reference markers preserved
                  for citation and cross-reference tracking.
         """
-        res = f"SECTION: {self.title}:\n" if self.title else ""
-        for child in self.children:
-            if isinstance(child, TextSection):
-                res += (
-                    "\n"
-                    + textwrap.indent(child.get_section_text_with_refs(), " " * 4)
-                    + "\n"
-                )
-            elif isinstance(child, TextParagraph):
-                res += "\n" + child.text_with_refs + "\n"
-            elif isinstance(child, TextFigure):
-                res += "\n" + str(child) + "\n"
-        return res
+        parts: list[str] = []
+        self._render_text(parts, "", with_refs=True)
+        return "".join(parts)
 
     def __eq__(self, other: object) -> bool:
         """Check equality based on title and child content.
@@ -1147,12 +1380,163 @@ class TextSection(TextElement):
         Returns:
             bool: True if other is a TextSection with identical title and children
         """
+        if self is other:
+            return True
+        if not isinstance(other, TextSection):
+            return False
+        # Differing structural hashes rule out equality without walking the
+        # two subtrees; the full comparison only runs when they match.
         return (
-            isinstance(other, TextSection)
+            self._struct_hash == other._struct_hash
             and self.title == other.title
             and self.children == other.children
         )
 
+    def _structure_hash(self) -> int:
+        """Hash the title and children consistently with ``__eq__``.
+
+        Called once the children are final.  Subsections contribute their own
+        cached hash, so building the whole tree hashes each node once.
+
+        Returns:
+            int: Hash of the title and the hashes of all children
+        """
+        return hash(
+            (
+                self.title,
+                tuple(
+                    child._struct_hash
+                    if isinstance(child, TextSection)
+                    else hash(child)
+                    for child in self.children
+                ),
+            )
+        )
+
+
+# Tag -> TextSection handler for every non-<sec> child tag with special
+# treatment; unlisted tags go to TextSection._build_fallback.  A handler
+# returns the child element to append, or None if it adds nothing.
+_SECTION_CHILD_HANDLERS: dict[
+    str,
+    Callable[
+        [TextSection, ET.Element, BasicBiMap],
+        "TextParagraph | TextTable | TextFigure | None",
+    ],
+] = {
+    **dict.fromkeys(_SECTION_BLOCK_AS_PARAGRAPH_TAGS, TextSection._build_block),
+    **dict.fromkeys(_SECTION_SKIP_TAGS, TextSection._skip_child),
+    "title": TextSection._read_title,
+    "p": TextSection._build_paragraph,
+    "table-wrap": TextSection._build_table,
+    "fig": TextSection._build_figure,
+}
+
+# Cell whitespace normalisation applied by pandas.read_html.
+_TABLE_CELL_WHITESPACE_RE = re.compile(r"[\r\n]+|\s{2,}")
+
+# XPath expressions evaluated for every table, compiled once at import.
+_TABLE_ELEMENTS_XPATH = ET.XPath("descendant-or-self::table")
+_TBODY_ROWS_XPATH = ET.XPath(".//tbody//tr")
+_TABLE_FOOTNOTES_XPATH = ET.XPath(".//table-wrap-foot//fn")
+
+# Markup that pandas.read_html treats specially once the XML is re-parsed as
+# HTML: line breaks, hidden/styled content, raw-text elements and cell spans.
+_HTML_SENSITIVE_TABLE_TAGS = frozenset(
+    {"br", "style", "script", "title", "textarea", "xmp", "tfoot"}
+)
+
+
+def _first_text_node(elements: Iterable[ET.Element]) -> str | None:
+    """Return the first text node directly inside any of *elements*.
+
+    Matches ``xpath("<path>/text()")[0]`` for the elements that path selects
+    (an element's leading text, then the tails of its children), without
+    running the XPath engine or returning a smart string that keeps the
+    whole document alive.
+    """
+    for element in elements:
+        if element.text:
+            return str(element.text)
+        for child in element:
+            if child.tail:
+                return str(child.tail)
+    return None
+
+
+def _simple_table_cells(
+    table_root: ET.Element,
+) -> tuple[list[list[str]], list[list[str]]] | None:
+    """Extract header and body cell text for tables read_html would not reshape.
+
+    Mirrors how ``pandas.read_html`` collects rows from a single table: header
+    rows come from ``<thead>``, or failing that from leading all-``<th>`` body
+    rows, and each cell's text has its whitespace collapsed.  Returns None when
+    the table needs the full HTML round trip instead (several tables, spans,
+    footers, line breaks, styled content, more than one header row, or no
+    text at all).
+
+    Args:
+        table_root: XML table-wrap (or table) element.
+
+    Returns:
+        Optional[tuple]: ``(head, body)`` lists of row cell texts, or None.
+    """
+    tables = _TABLE_ELEMENTS_XPATH(table_root)
+    if len(tables) != 1:
+        return None
+    table_el = tables[0]
+    for el in table_el.iterdescendants(ET.Element):
+        attrib = el.attrib
+        if el.tag in _HTML_SENSITIVE_TABLE_TAGS or "style" in attrib:
+            return None
+        if "rowspan" in attrib or "colspan" in attrib:
+            return None
+    if not text_content(table_el):
+        return None
+
+    head_rows = []
+    for thead in table_el.iter("thead"):
+        if next(thead.iterchildren("td", "th"), None) is not None:
+            return None
+        head_rows.extend(thead.iterchildren("tr"))
+    body_rows = _TBODY_ROWS_XPATH(table_el) + list(table_el.iterchildren("tr"))
+    if not head_rows:
+        while body_rows and all(
+            cell.tag == "th" for cell in body_rows[0].iterchildren("td", "th")
+        ):
+            head_rows.append(body_rows.pop(0))
+    if len(head_rows) > 1 or not (head_rows or body_rows):
+        return None
+
+    def cells(tr: ET.Element) -> list[str]:
+        return [
+            _TABLE_CELL_WHITESPACE_RE.sub(" ", text_content(cell))
+            for cell in tr.iterchildren("td", "th")
+        ]
+
+    return [cells(tr) for tr in head_rows], [cells(tr) for tr in body_rows]
+
+
+def _frame_from_cells(head: list[list[str]], body: list[list[str]]) -> pd.DataFrame:
+    """Build the DataFrame ``pandas.read_html`` would for the given cells.
+
+    Rows are padded to equal length and fed through the same ``TextParser``
+    settings read_html uses, so column names and dtypes match exactly.
+
+    Args:
+        head: Header row cell texts (at most one row).
+        body: Body row cell texts.
+
+    Returns:
+        pd.DataFrame: Parsed table.
+    """
+    data = head + body
+    width = max(map(len, data))
+    data = [row + [""] * (width - len(row)) for row in data]
+    with TextParser(data, header=0 if head else None, thousands=",") as parser:
+        return parser.read()
+
 
 class TextTable(TextElement):
     """Table element with pandas DataFrame representation and metadata.
@@ -1165,6 +1549,8 @@ class TextTable(TextElement):
     Attributes:
         df (Optional[pd.io.formats.style.Styler]): Parsed table as styled DataFrame,
                                                    None if parsing failed
+        table_dict (Optional[dict]): Columns, rows and footnotes of the table,
+                                     None if the table could not be parsed
 
     The table parser uses pandas' read_html() function to extract tabular data
     from the XML representation, automatically handling common table structures
@@ -1181,6 +1567,15 @@ class TextTable(TextElement):
         >>> print(str(table))
     """
 
+    __slots__ = (
+        "caption",
+        "df",
+        "footnotes",
+        "label",
+        "table_dict",
+        "table_id",
+    )
+
     def __init__(
         self,
         table_root: ET.Element,
@@ -1203,34 +1598,54 @@ class TextTable(TextElement):
                            or unsupported table structure
         """
         super().__init__(table_root, parent, ref_map)
-        label_parts = table_root.xpath("label/text()")
-        caption_parts = table_root.xpath("caption/p/text()")
         self.table_id: str | None = table_root.get("id")
-        self.label: str | None = label_parts[0] if label_parts else None
-        self.caption: str | None = caption_parts[0] if caption_parts else None
-        self.df: pd.io.formats.style.Styler | None = None
-
-        # --- Structured representation (always populated if possible) ---
-        self.table_dict: dict | None = None
+        self.label: str | None = _first_text_node(table_root.iterchildren("label"))
+        self.caption: str | None = _first_text_node(
+            p
+            for caption in table_root.iterchildren("caption")
+            for p in caption.iterchildren("p")
+        )
 
         # --- Footnotes ---
         footnotes: list[str] = []
-        for fn in table_root.xpath(".//table-wrap-foot//fn"):
-            fn_text = "".join(fn.itertext()).strip()
+        for fn in _TABLE_FOOTNOTES_XPATH(table_root):
+            fn_text = text_content(fn)
             if fn_text:
                 footnotes.append(fn_text)
         self.footnotes: list[str] = footnotes
 
-        # pandas.read_html expects a string / file-like / URL. Passing raw bytes
-        # can be interpreted as a filesystem path on newer pandas versions.
-        table_xml_str = ET.tostring(table_root, encoding="unicode")
+        self.df: pd.io.formats.style.Styler | None = None
+        self.table_dict: dict | None = None
+        self._parse_table(table_root)
 
-        # --- Attempt 1: pandas read_html ---
-        try:
-            # Pass a file-like object to avoid pandas interpreting the string as a path.
-            from io import StringIO
+    def _parse_table(self, table_root: ET.Element) -> None:
+        """Populate ``df`` and ``table_dict`` from *table_root*.
 
-            tables = pd.read_html(StringIO(table_xml_str))
+        Runs the read_html path first, then the lxml fallback.
+        """
+        # --- Attempt 1: pandas ---
+        try:
+            # Plain tables are built straight from the lxml tree; anything
+            # read_html would reshape (spans, several header rows, ...) goes
+            # through the full HTML round trip.
+            cells = _simple_table_cells(table_root)
+            if cells is not None:
+                tables = [_frame_from_cells(*cells)]
+            else:
+                # pandas.read_html expects a string / file-like / URL. Passing
+                # raw bytes can be interpreted as a filesystem path on newer
+                # pandas versions, so wrap the markup in a file-like object.
+                # When the wrap holds a single <table>, only that element is
+                # serialised; the label, caption and footnotes around it
+                # don't affect what read_html returns for it.
+                html_tables = table_root.iter("table")
+                markup_root = next(html_tables, None)
+                if markup_root is None or next(html_tables, None) is not None:
+                    markup_root = table_root
+                table_xml_str = ET.tostring(
+                    markup_root, encoding="unicode", with_tail=False
+                )
+                tables = pd.read_html(StringIO(table_xml_str))
             if tables:
                 raw_df = tables[0]
                 # Flatten MultiIndex columns (produced by colspan/rowspan headers)
@@ -1264,7 +1679,7 @@ class TextTable(TextElement):
             warnings.warn(
                 f"Table parsing failed (label: {self.label}, caption: {self.caption}): {e}",
                 ReadHTMLFailure,
-                stacklevel=2,
+                stacklevel=3,
             )
 
         # --- Attempt 2: lxml native fallback ---
@@ -1277,16 +1692,17 @@ class TextTable(TextElement):
                 if table_el is not None:
                     # Headers
                     for thead in table_el.findall(".//thead"):
-                        for tr in thead.findall("tr"):
-                            for th in tr.findall("th"):
-                                columns.append("".join(th.itertext()).strip())
+                        for tr in thead.iterchildren("tr"):
+                            columns.extend(
+                                text_content(th) for th in tr.iterchildren("th")
+                            )
                     # Body rows
                     for tbody_or_table in table_el.findall(".//tbody") or [table_el]:
-                        for tr in tbody_or_table.findall("tr"):
-                            row: list[str] = []
-                            for cell in tr:
-                                if cell.tag in ("td", "th"):
-                                    row.append("".join(cell.itertext()).strip())
+                        for tr in tbody_or_table.iterchildren("tr"):
+                            row = [
+                                text_content(cell)
+                                for cell in tr.iterchildren("td", "th")
+                            ]
                             if row:
                                 rows.append(row)
                     if columns or rows:
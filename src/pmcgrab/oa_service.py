@@ -45,8 +45,12 @@ Functions:
 
 from __future__ import annotations
 
-import xml.etree.ElementTree as ET
+from functools import lru_cache
+from io import BytesIO
 
+import lxml.etree as ET
+
+from pmcgrab.common.xml_processing import REMOTE_PARSE_OPTIONS
 from pmcgrab.http_utils import cached_get
 
 _BASE_URL = "https://www.ncbi.nlm.nih.gov/pmc/utils/oa/oa.fcgi"
@@ -65,9 +69,8 @@ def _parse_oa_record(rec: ET.Element) -> dict[str, str]:
     Returns:
         dict[str, str]: Parsed record data with attribute and element information
     """
-    out: dict[str, str] = dict(rec.attrib.items())
-    for link in rec:
-        out[link.tag] = link.text or ""
+    out: dict[str, str] = dict(rec.attrib)
+    out.update((link.tag, link.text or "") for link in rec.iterchildren(ET.Element))
     return out
 
 
@@ -96,7 +99,7 @@ def fetch(article_id: str, id_type: str = "pmcid") -> dict[str, str] | None:
 
     Raises:
         requests.HTTPError: If API request fails due to network issues
-        xml.etree.ElementTree.ParseError: If API returns malformed XML
+        lxml.etree.XMLSyntaxError: If API returns malformed XML
         requests.RequestException: If request fails after retries
 
     Examples:
@@ -136,8 +139,19 @@ def fetch(article_id: str, id_type: str = "pmcid") -> dict[str, str] | None:
         returned are direct download links that can be used programmatically.
 
         Requests are cached using pmcgrab.http_utils.cached_get for
-        improved performance on repeated queries.
+        improved performance on repeated queries, and parsed records are
+        memoised per ``(article_id, id_type)``. Each call returns a fresh
+        copy, so callers may modify the result.
     """
+    record = _fetch_record(article_id, id_type)
+    if record is None:
+        return None
+    return dict(record)
+
+
+@lru_cache(maxsize=4096)
+def _fetch_record(article_id: str, id_type: str) -> dict[str, str] | None:
+    """Fetch and parse the first OA record; cached backing store for fetch."""
     rec = _first_record(article_id, id_type)
     if rec is None:
         return None
@@ -161,13 +175,33 @@ def _first_record(article_id: str, id_type: str) -> ET.Element | None:
         params={"id": article_id},
         headers={"User-Agent": f"pmcgrab/{__version__}"},
     )
-    root = ET.fromstring(resp.content)
+    # The body is already buffered; iterparse only lets the scan stop once
+    # the wanted record is complete instead of building the whole reply.
     # The OA service wraps records inside a <records> container, but the
-    # historical fetch() code calls root.find("record"). Support both.
-    records_container = root.find("records")
-    if records_container is not None:
-        return records_container.find("record")
-    return root.find("record")
+    # historical fetch() code looked for root-level <record>. As before, the
+    # first record of the first top-level <records> wins and a root-level
+    # <record> is used only when there is no such container.
+    events = ET.iterparse(
+        BytesIO(resp.content),
+        events=("end",),
+        tag=("record", "records"),
+        **REMOTE_PARSE_OPTIONS,
+    )
+    root_record: ET.Element | None = None
+    for _, elem in events:
+        parent = elem.getparent()
+        if parent is None:
+            continue
+        container = parent.getparent()
+        if elem.tag == "records":
+            if container is None:
+                return None
+        elif container is None:
+            if root_record is None:
+                root_record = elem
+        elif parent.tag == "records" and container.getparent() is None:
+            return elem
+    return root_record
 
 
 def list_oa_links(article_id: str, id_type: str = "pmcid") -> list[dict[str, str]]:
@@ -192,7 +226,7 @@ def list_oa_links(article_id: str, id_type: str = "pmcid") -> list[dict[str, str
         return []
     links: list[dict[str, str]] = []
     for link in rec.findall("link"):
-        entry: dict[str, str] = dict(link.attrib.items())
+        entry: dict[str, str] = dict(link.attrib)
         text = (link.text or "").strip()
         if text:
             entry["text"] = text
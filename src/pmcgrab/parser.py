@@ -26,6 +26,9 @@ The public API is intentionally compact:
 • `build_complete_paper_dict` – low-level entry point that coordinates
   all the `gather_*` helper functions and assembles their outputs.
 
+• `warnings_suppressed` – context manager that silences parser warnings
+  once for a whole batch instead of once per article.
+
 In addition, the module re-exports a collection of `gather_*`
 functions (title, authors, abstract, body, journal info …) so that
 callers do not need to remember the exact sub-module where each helper
@@ -59,7 +62,8 @@ DTD validation, HTML cleaning, and external service wrappers.
 
 import re
 import warnings
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from typing import Any, NoReturn
 
 import lxml.etree as ET
@@ -70,6 +74,7 @@ from pmcgrab.application.parsing import contributors as _contributors
 from pmcgrab.application.parsing import jats_records as _jats_records
 from pmcgrab.application.parsing import metadata as _metadata
 from pmcgrab.application.parsing import sections as _sections
+from pmcgrab.common.xml_processing import text_content
 from pmcgrab.constants import (
     MalformedRefTagWarning,
     UnmatchedCitationWarning,
@@ -108,6 +113,45 @@ gather_issue = _metadata.gather_issue
 
 # Pages (remain local – trivial one-liners)
 
+# Expressions evaluated for every article are compiled once at import time
+# instead of being re-parsed by ``root.xpath`` on each call.
+_FPAGE_XPATH = ET.XPath("//article-meta/fpage/text()")
+_LPAGE_XPATH = ET.XPath("//article-meta/lpage/text()")
+_ELOCATION_ID_XPATH = ET.XPath("//article-meta/elocation-id/text()")
+_COUNT_XPATH = ET.XPath("//article-meta/counts/count")
+_NAMED_COUNT_XPATHS = {
+    tag: ET.XPath(f"//article-meta/counts/{tag}")
+    for tag in (
+        "fig-count",
+        "table-count",
+        "equation-count",
+        "ref-count",
+        "page-count",
+        "word-count",
+    )
+}
+_SELF_URI_XPATH = ET.XPath("//article-meta/self-uri")
+_RELATED_ARTICLE_XPATH = ET.XPath("//article-meta/related-article")
+_CONFERENCE_XPATH = ET.XPath("//article-meta/conference")
+_SUBTITLE_XPATH = ET.XPath("//article-meta/title-group/subtitle")
+_AUTHOR_NOTES_XPATH = ET.XPath("//article-meta/author-notes")
+_APPENDIX_XPATH = ET.XPath("//back//app")
+_GLOSSARY_XPATH = ET.XPath("//back//glossary")
+_TRANS_TITLE_GROUP_XPATH = ET.XPath("//article-meta/title-group/trans-title-group")
+# Record builders for the structured (v3/v4) output.
+_BACK_REF_XPATH = ET.XPath("//back//ref")
+_ABSTRACT_XPATH = ET.XPath("//article-meta/abstract")
+_ARTICLE_ID_XPATH = ET.XPath("//article-meta/article-id")
+_TITLE_GROUP_XPATH = ET.XPath("//article-meta/title-group")
+_KWD_GROUP_XPATH = ET.XPath("//article-meta/kwd-group")
+_SUBJ_GROUP_XPATH = ET.XPath("//article-meta/article-categories//subj-group")
+_AFF_XPATH = ET.XPath("//article-meta//aff")
+_CONTRIB_XPATH = ET.XPath("//article-meta//contrib")
+_LICENSE_XPATH = ET.XPath("//article-meta/permissions/license")
+_PUB_DATE_XPATH = ET.XPath("//article-meta/pub-date")
+_HISTORY_DATE_XPATH = ET.XPath("//article-meta/history/date")
+_ARTICLE_VERSION_XPATH = ET.XPath("//article-meta/article-version")
+
 
 def gather_fpage(root: ET.Element) -> str | None:
     """Extract the first page number from PMC article metadata.
@@ -123,7 +167,7 @@ def gather_fpage(root: ET.Element) -> str | None:
         >>> first_page = gather_fpage(root)
         >>> print(f"Article starts on page: {first_page}")
     """
-    fpage = root.xpath("//article-meta/fpage/text()")
+    fpage = _FPAGE_XPATH(root)
     return fpage[0] if fpage else None
 
 
@@ -141,7 +185,7 @@ def gather_lpage(root: ET.Element) -> str | None:
         >>> last_page = gather_lpage(root)
         >>> print(f"Article ends on page: {last_page}")
     """
-    lpage = root.xpath("//article-meta/lpage/text()")
+    lpage = _LPAGE_XPATH(root)
     return lpage[0] if lpage else None
 
 
@@ -156,7 +200,7 @@ def gather_elocation_id(root: ET.Element) -> str | None:
     Returns:
         str | None: Electronic location ID as string, or None if not found
     """
-    eloc = root.xpath("//article-meta/elocation-id/text()")
+    eloc = _ELOCATION_ID_XPATH(root)
     return eloc[0] if eloc else None
 
 
@@ -173,7 +217,7 @@ def gather_counts(root: ET.Element) -> dict[str, int]:
         dict[str, int]: Mapping of count types to values
     """
     counts: dict[str, int] = {}
-    for count_elem in root.xpath("//article-meta/counts/count"):
+    for count_elem in _COUNT_XPATH(root):
         count_type = count_elem.get("count-type")
         if count_type:
             try:
@@ -181,15 +225,8 @@ def gather_counts(root: ET.Element) -> dict[str, int]:
             except (ValueError, TypeError):
                 pass
     # Also check specific named count elements
-    for tag in (
-        "fig-count",
-        "table-count",
-        "equation-count",
-        "ref-count",
-        "page-count",
-        "word-count",
-    ):
-        elems = root.xpath(f"//article-meta/counts/{tag}")
+    for tag, xpath in _NAMED_COUNT_XPATHS.items():
+        elems = xpath(root)
         if elems:
             try:
                 counts[tag.replace("-", "_")] = int(elems[0].get("count", "0"))
@@ -208,7 +245,7 @@ def gather_self_uri(root: ET.Element) -> list[dict[str, str]]:
         list[dict[str, str]]: List of URI dicts with 'href' and 'content_type' keys
     """
     uris: list[dict[str, str]] = []
-    for uri in root.xpath("//article-meta/self-uri"):
+    for uri in _SELF_URI_XPATH(root):
         href = (
             uri.get("{http://www.w3.org/1999/xlink}href") or uri.get("xlink:href") or ""
         )
@@ -228,7 +265,7 @@ def gather_related_articles(root: ET.Element) -> list[dict[str, str]]:
         list[dict[str, str]]: List of related article dicts
     """
     articles: list[dict[str, str]] = []
-    for rel in root.xpath("//article-meta/related-article"):
+    for rel in _RELATED_ARTICLE_XPATH(root):
         href = (
             rel.get("{http://www.w3.org/1999/xlink}href") or rel.get("xlink:href") or ""
         )
@@ -252,7 +289,7 @@ def gather_conference_info(root: ET.Element) -> dict[str, str] | None:
     Returns:
         dict[str, str] | None: Conference info or None if not a conference paper
     """
-    conf = root.xpath("//article-meta/conference")
+    conf = _CONFERENCE_XPATH(root)
     if not conf:
         return None
     c = conf[0]
@@ -289,29 +326,29 @@ gather_abstract_type = _sections.gather_abstract_type
 
 def gather_subtitle(root: ET.Element) -> str | None:
     """Extract article subtitle from PMC XML."""
-    subs = root.xpath("//article-meta/title-group/subtitle")
+    subs = _SUBTITLE_XPATH(root)
     if subs:
-        return "".join(subs[0].itertext()).strip() or None
+        return text_content(subs[0]) or None
     return None
 
 
 def gather_author_notes(root: ET.Element) -> dict[str, Any] | None:
     """Extract author-notes: correspondence, present addresses, footnotes."""
-    notes_el = root.xpath("//article-meta/author-notes")
+    notes_el = _AUTHOR_NOTES_XPATH(root)
     if not notes_el:
         return None
     result: dict[str, Any] = {}
     # Correspondence
     corresp = []
-    for c in notes_el[0].xpath("corresp"):
-        corresp.append("".join(c.itertext()).strip())
+    for c in notes_el[0].iterchildren("corresp"):
+        corresp.append(text_content(c))
     if corresp:
         result["correspondence"] = corresp
     # Footnotes within author-notes
     fns = []
-    for fn in notes_el[0].xpath("fn"):
+    for fn in notes_el[0].iterchildren("fn"):
         fn_type = fn.get("fn-type", "")
-        text = "".join(fn.itertext()).strip()
+        text = text_content(fn)
         if text:
             fns.append({"type": fn_type, "text": text})
     if fns:
@@ -322,10 +359,10 @@ def gather_author_notes(root: ET.Element) -> dict[str, Any] | None:
 def gather_appendices(root: ET.Element) -> list[dict[str, str]] | None:
     """Extract appendices from <back>/<app-group>/<app>."""
     apps: list[dict[str, str]] = []
-    for app in root.xpath("//back//app"):
+    for app in _APPENDIX_XPATH(root):
         title_el = app.find("title")
-        title = "".join(title_el.itertext()).strip() if title_el is not None else ""
-        text = "".join(app.itertext()).strip()
+        title = text_content(title_el) if title_el is not None else ""
+        text = text_content(app)
         if title and text.startswith(title):
             text = text[len(title) :].strip()
         apps.append({"title": title, "text": text})
@@ -335,12 +372,12 @@ def gather_appendices(root: ET.Element) -> list[dict[str, str]] | None:
 def gather_glossary(root: ET.Element) -> list[dict[str, str]] | None:
     """Extract glossary / definition-list entries from <back>/<glossary>."""
     entries: list[dict[str, str]] = []
-    for glossary in root.xpath("//back//glossary"):
-        for def_item in glossary.xpath(".//def-item"):
+    for glossary in _GLOSSARY_XPATH(root):
+        for def_item in glossary.iterdescendants("def-item"):
             term_el = def_item.find("term")
             def_el = def_item.find("def")
-            term = "".join(term_el.itertext()).strip() if term_el is not None else ""
-            defn = "".join(def_el.itertext()).strip() if def_el is not None else ""
+            term = text_content(term_el) if term_el is not None else ""
+            defn = text_content(def_el) if def_el is not None else ""
             entries.append({"term": term, "definition": defn})
     return entries or None
 
@@ -348,20 +385,20 @@ def gather_glossary(root: ET.Element) -> list[dict[str, str]] | None:
 def gather_translated_titles(root: ET.Element) -> list[dict[str, str]] | None:
     """Extract translated titles from <trans-title-group>."""
     titles: list[dict[str, str]] = []
-    for ttg in root.xpath("//article-meta/title-group/trans-title-group"):
+    for ttg in _TRANS_TITLE_GROUP_XPATH(root):
         lang = ttg.get("{http://www.w3.org/XML/1998/namespace}lang", "")
         tt = ttg.find("trans-title")
         if tt is not None:
-            titles.append({"lang": lang, "title": "".join(tt.itertext()).strip()})
+            titles.append({"lang": lang, "title": text_content(tt)})
     return titles or None
 
 
 def gather_translated_abstracts(root: ET.Element) -> list[dict[str, str]] | None:
     """Extract translated abstracts from <trans-abstract>."""
     abstracts: list[dict[str, str]] = []
-    for ta in root.xpath("//trans-abstract"):
+    for ta in root.getroottree().iter("trans-abstract"):
         lang = ta.get("{http://www.w3.org/XML/1998/namespace}lang", "")
-        text = "".join(ta.itertext()).strip()
+        text = text_content(ta)
         abstracts.append({"lang": lang, "text": text})
     return abstracts or None
 
@@ -369,7 +406,7 @@ def gather_translated_abstracts(root: ET.Element) -> list[dict[str, str]] | None
 def gather_tex_equations(root: ET.Element) -> list[str] | None:
     """Extract TeX/LaTeX equations from <tex-math> elements."""
     eqs: list[str] = []
-    for tex in root.xpath("//tex-math"):
+    for tex in root.getroottree().iter("tex-math"):
         if tex.text:
             eqs.append(tex.text.strip())
     return eqs or None
@@ -380,6 +417,45 @@ def gather_tex_equations(root: ET.Element) -> list[str] | None:
 # ---------------------------------------------------------------------------
 
 
+# Cross-reference targets keyed by ``(tag, id)``, or ``(None, id)`` for any tag.
+_IdIndex = dict[tuple[str | None, str], ET.Element]
+# Parsed citations keyed by their ``<ref>`` element, for one document.
+_CitationCache = dict[ET.Element, dict[str, Any] | str]
+
+
+def _person_name(name_el: ET.Element) -> str:
+    """Return "Given Surname" for a ``<name>`` element ("" if both are absent)."""
+    given = name_el.findtext("given-names") or ""
+    surname = name_el.findtext("surname") or ""
+    return f"{given} {surname}".strip()
+
+
+def _index_descendants(
+    citation_root: ET.Element,
+) -> tuple[dict[Any, ET.Element], dict[Any, list[ET.Element]]]:
+    """Index a citation's descendants in one walk.
+
+    Returns ``(first, every)``. ``first`` maps each tag to its first element
+    (what ``citation_root.find(".//tag")`` would return), with ``pub-id``
+    also keyed by ``("pub-id", type)``. ``every`` lists, in document order,
+    all ``ext-link`` elements under ``"ext-link"`` and all ``person-group``
+    elements under ``("person-group", type)``.
+    """
+    first: dict[Any, ET.Element] = {}
+    every: dict[Any, list[ET.Element]] = {}
+    for element in citation_root.iterdescendants(ET.Element):
+        tag = element.tag
+        if tag == "pub-id":
+            first.setdefault((tag, element.get("pub-id-type")), element)
+        elif tag == "person-group":
+            key = (tag, element.get("person-group-type"))
+            every.setdefault(key, []).append(element)
+        elif tag == "ext-link":
+            every.setdefault(tag, []).append(element)
+        first.setdefault(tag, element)
+    return first, every
+
+
 def _parse_citation(
     citation_root: ET.Element,
 ) -> dict[str, Any] | str:
@@ -414,41 +490,41 @@ def _parse_citation(
         >>> print(f"Authors: {citation_data['authors']}")
         >>> print(f"Title: {citation_data['title']}")
     """
+    # One walk indexes the subtree; the fields below are read from it
+    # instead of running one query per field.
+    first, every = _index_descendants(citation_root)
+
     # --- Author extraction (name + collab + etal) ---
     author_names: list[str] = []
 
     # Named authors (person-group type="author")
-    for pg in citation_root.xpath('.//person-group[@person-group-type="author"]'):
-        for name_el in pg.xpath("name"):
-            given = _extract_xpath_text(name_el, "given-names") or ""
-            surname = _extract_xpath_text(name_el, "surname") or ""
-            name = f"{given} {surname}".strip()
+    for pg in every.get(("person-group", "author"), ()):
+        for name_el in pg.iterchildren("name"):
+            name = _person_name(name_el)
             if name:
                 author_names.append(name)
         # Collaborative group authors
-        for collab in pg.xpath("collab"):
-            collab_text = "".join(collab.itertext()).strip()
+        for collab in pg.iterchildren("collab"):
+            collab_text = text_content(collab)
             if collab_text:
                 author_names.append(collab_text)
 
     # Fallback: <name> directly under the element-citation/mixed-citation
     if not author_names:
-        for name_el in citation_root.xpath(".//name"):
-            given = _extract_xpath_text(name_el, "given-names") or ""
-            surname = _extract_xpath_text(name_el, "surname") or ""
-            name = f"{given} {surname}".strip()
+        for name_el in citation_root.iterdescendants("name"):
+            name = _person_name(name_el)
             if name:
                 author_names.append(name)
 
     # Standalone <collab> outside person-group
     if not author_names:
-        for collab in citation_root.xpath(".//collab"):
-            collab_text = "".join(collab.itertext()).strip()
+        for collab in citation_root.iterdescendants("collab"):
+            collab_text = text_content(collab)
             if collab_text:
                 author_names.append(collab_text)
 
     # Check for <etal/>
-    has_etal = len(citation_root.xpath(".//etal")) > 0
+    has_etal = "etal" in first
 
     if not author_names:
         mixed = citation_root.xpath(".//mixed-citation/text()")
@@ -463,57 +539,56 @@ def _parse_citation(
     # --- Determine citation type ---
     pub_type = None
     for child_tag in ("element-citation", "mixed-citation", "nlm-citation"):
-        child = citation_root.find(f".//{child_tag}")
+        child = first.get(child_tag)
         if child is not None:
             pub_type = child.get("publication-type")
             break
 
     # --- Build result dict ---
+    def text(key: Any) -> str | None:
+        element = first.get(key)
+        return None if element is None else element.text
+
     result: dict[str, Any] = {
         "authors": author_names,
         "has_etal": has_etal,
         "publication_type": pub_type,
-        "title": (
-            _extract_xpath_text(citation_root, ".//article-title")
-            or _extract_xpath_text(citation_root, ".//chapter-title")
-        ),
-        "source": _extract_xpath_text(citation_root, ".//source"),
-        "year": _extract_xpath_text(citation_root, ".//year"),
-        "volume": _extract_xpath_text(citation_root, ".//volume"),
-        "issue": _extract_xpath_text(citation_root, ".//issue"),
-        "first_page": _extract_xpath_text(citation_root, ".//fpage"),
-        "last_page": _extract_xpath_text(citation_root, ".//lpage"),
-        "elocation_id": _extract_xpath_text(citation_root, ".//elocation-id"),
-        "doi": _extract_xpath_text(citation_root, './/pub-id[@pub-id-type="doi"]'),
-        "pmid": _extract_xpath_text(citation_root, './/pub-id[@pub-id-type="pmid"]'),
-        "pmcid": _extract_xpath_text(citation_root, './/pub-id[@pub-id-type="pmcid"]'),
-        "isbn": _extract_xpath_text(citation_root, ".//isbn"),
-        "publisher_name": _extract_xpath_text(citation_root, ".//publisher-name"),
-        "publisher_loc": _extract_xpath_text(citation_root, ".//publisher-loc"),
-        "edition": _extract_xpath_text(citation_root, ".//edition"),
-        "comment": _extract_xpath_text(citation_root, ".//comment"),
+        "title": text("article-title") or text("chapter-title"),
+        "source": text("source"),
+        "year": text("year"),
+        "volume": text("volume"),
+        "issue": text("issue"),
+        "first_page": text("fpage"),
+        "last_page": text("lpage"),
+        "elocation_id": text("elocation-id"),
+        "doi": text(("pub-id", "doi")),
+        "pmid": text(("pub-id", "pmid")),
+        "pmcid": text(("pub-id", "pmcid")),
+        "isbn": text("isbn"),
+        "publisher_name": text("publisher-name"),
+        "publisher_loc": text("publisher-loc"),
+        "edition": text("edition"),
+        "comment": text("comment"),
         # Book-specific fields
-        "chapter_title": _extract_xpath_text(citation_root, ".//chapter-title"),
-        "part_title": _extract_xpath_text(citation_root, ".//part-title"),
+        "chapter_title": text("chapter-title"),
+        "part_title": text("part-title"),
         # Conference-specific fields
-        "conf_name": _extract_xpath_text(citation_root, ".//conf-name"),
-        "conf_date": _extract_xpath_text(citation_root, ".//conf-date"),
-        "conf_loc": _extract_xpath_text(citation_root, ".//conf-loc"),
+        "conf_name": text("conf-name"),
+        "conf_date": text("conf-date"),
+        "conf_loc": text("conf-loc"),
         # Data citation fields
-        "data_title": _extract_xpath_text(citation_root, ".//data-title"),
+        "data_title": text("data-title"),
         # Patent fields
-        "patent": _extract_xpath_text(citation_root, ".//patent"),
+        "patent": text("patent"),
         # External links / URIs
-        "uri": _extract_xpath_text(citation_root, ".//uri"),
+        "uri": text("uri"),
     }
 
     # Editors
     editor_names: list[str] = []
-    for pg in citation_root.xpath('.//person-group[@person-group-type="editor"]'):
-        for name_el in pg.xpath("name"):
-            given = _extract_xpath_text(name_el, "given-names") or ""
-            surname = _extract_xpath_text(name_el, "surname") or ""
-            name = f"{given} {surname}".strip()
+    for pg in every.get(("person-group", "editor"), ()):
+        for name_el in pg.iterchildren("name"):
+            name = _person_name(name_el)
             if name:
                 editor_names.append(name)
     if editor_names:
@@ -521,7 +596,7 @@ def _parse_citation(
 
     # External links
     ext_links = []
-    for ext in citation_root.xpath(".//ext-link"):
+    for ext in every.get("ext-link", ()):
         href = ext.get("{http://www.w3.org/1999/xlink}href") or ext.get(
             "xlink:href", ""
         )
@@ -531,9 +606,9 @@ def _parse_citation(
         result["ext_links"] = ext_links
 
     # Add full mixed-citation text as fallback
-    mixed_elems = citation_root.xpath(".//mixed-citation")
-    if mixed_elems:
-        result["mixed_citation_text"] = "".join(mixed_elems[0].itertext()).strip()
+    mixed_citation = first.get("mixed-citation")
+    if mixed_citation is not None:
+        result["mixed_citation_text"] = text_content(mixed_citation)
 
     return result
 
@@ -609,92 +684,143 @@ def process_reference_map(
         >>> # Auto-generate from document refs
         >>> ref_map = process_reference_map(root, None)
     """
+    return _resolve_reference_map(paper_root, ref_map)[0]
+
+
+def _resolve_reference_map(
+    paper_root: ET.Element,
+    ref_map: BasicBiMap | None,
+    parsed_citations: _CitationCache | None = None,
+) -> tuple[BasicBiMap, list[Any], list[Any], list[Any]]:
+    """Resolve *ref_map* and sort the results into citations, tables and figures.
+
+    Each resolved object is classified as soon as it is produced, so
+    build_complete_paper_dict gets the resolved map and its citation, table
+    and figure lists from a single pass.
+
+    Args:
+        paper_root: Root element of the complete PMC article XML
+        ref_map: Reference placeholders, as for process_reference_map
+        parsed_citations: Optional per-document cache of _parse_citation
+            results keyed by ``<ref>`` element; filled as refs are parsed
+            so later passes over the same tree can reuse them.
+
+    Returns:
+        tuple: The resolved map, then citations, table DataFrames and
+        figure dicts in map order
+    """
     if ref_map is None:
         ref_map = BasicBiMap()
+    if parsed_citations is None:
+        parsed_citations = {}
     cleaned: dict[Any, Any] = {}
+    citations: list[Any] = []
+    tables: list[Any] = []
+    figures: list[Any] = []
+
+    def _add(key: Any, value: Any) -> None:
+        cleaned[key] = value
+        rtype = _get_ref_type(value)
+        if rtype == "citation":
+            citations.append(value)
+        elif rtype == "table":
+            tables.append(value.df)
+        elif rtype == "fig":
+            figures.append(value if isinstance(value, dict) else value.fig_dict)
 
     # Fallback: if the ref_map is empty populate it from <ref> elements so that
     # downstream logic and tests receive *something* meaningful to work with.
     if not ref_map:
-        for idx, ref in enumerate(paper_root.xpath("//ref")):
-            cleaned[idx] = _parse_citation(ref)
-        return BasicBiMap(cleaned)
+        for idx, ref in enumerate(paper_root.getroottree().iter("ref")):
+            _add(idx, _cached_citation(parsed_citations, ref))
+        return BasicBiMap(cleaned), citations, tables, figures
 
     # Resolve existing placeholder references from *ref_map* ------------
+    id_index = _build_id_index(paper_root)
+    # Several xrefs (e.g. "[1]" and "Smith et al.") often point at the same
+    # target; resolve each (ref-type, rid) pair once and share the result.
+    resolved_xrefs: dict[tuple[str | None, str | None], Any] = {}
     for key, item in ref_map.items():
         try:
             root = ET.fromstring(item)
         except ET.XMLSyntaxError:
             warnings.warn(
-                f"Malformed reference tag in ref_map (key={key}); skipping: {item[:80]}",
+                f"Malformed reference tag in ref_map (key={key}); "
+                f"skipping: {item[:80]}",
                 MalformedRefTagWarning,
                 stacklevel=2,
             )
             continue
         if root.tag == "xref":
-            resolved = _resolve_xref(paper_root, root)
+            target = (root.get("ref-type"), root.get("rid"))
+            resolved = resolved_xrefs.get(target)
+            if resolved is None:
+                resolved = _resolve_xref(id_index, root, parsed_citations)
             if resolved is not None:
-                cleaned[key] = resolved
+                resolved_xrefs[target] = resolved
+                _add(key, resolved)
         elif root.tag == "table-wrap":
-            cleaned[key] = TextTable(root)
+            _add(key, TextTable(root))
         elif root.tag == "fig":
-            cleaned[key] = TextFigure(root)
+            _add(key, TextFigure(root))
         else:
-            cleaned[key] = ET.tostring(root)
+            _add(key, ET.tostring(root))
+    return BasicBiMap(cleaned), citations, tables, figures
 
-    # Resolve back-references (numeric indirection)
-    for key, val in cleaned.items():
-        if isinstance(val, int):
-            cleaned[key] = cleaned.get(val, val)
-    return BasicBiMap(cleaned)
+
+def _build_id_index(paper_root: ET.Element) -> _IdIndex:
+    """Index every element that carries an ``id`` in a single traversal.
+
+    Keys are ``(tag, id)`` for tag-specific lookups and ``(None, id)`` for
+    lookups by id alone. The first element in document order wins, as it
+    did for the ``//tag[@id=...]`` queries this replaces.
+    """
+    index: _IdIndex = {}
+    for element in paper_root.getroottree().iter(ET.Element):
+        element_id = element.get("id")
+        if element_id is not None:
+            index.setdefault((element.tag, element_id), element)
+            index.setdefault((None, element_id), element)
+    return index
 
 
-def _resolve_xref(paper_root: ET.Element, xref: ET.Element) -> Any | None:
+def _resolve_xref(
+    id_index: _IdIndex, xref: ET.Element, parsed_citations: _CitationCache
+) -> Any | None:
     """Resolve a single ``xref`` element into its referenced object."""
     rtype = xref.get("ref-type")
     rid = xref.get("rid")
     if rtype == "bibr":
-        return _resolve_citation_xref(paper_root, rid)
+        return _resolve_citation_xref(id_index, rid, parsed_citations)
     if rtype == "table":
-        return _resolve_table_xref(paper_root, rid)
+        return _resolve_table_xref(id_index, rid)
     if rtype == "fig" and rid:
-        return _first_mapped(paper_root, f"//fig[@id='{rid}']", TextFigure)
+        return _first_mapped(id_index, "fig", rid, TextFigure)
     if rtype == "fn" and rid:
-        return _first_text(paper_root, f"//fn[@id='{rid}']")
+        return _target_text(id_index, "fn", rid)
     if rtype == "supplementary-material" and rid:
         return _typed_text_payload(
-            paper_root,
-            f"//supplementary-material[@id='{rid}']",
-            "supplementary-material",
-            rid,
+            id_index, "supplementary-material", "supplementary-material", rid
         )
     if rtype == "disp-formula" and rid:
-        return _typed_text_payload(
-            paper_root, f"//disp-formula[@id='{rid}']", "formula", rid
-        )
+        return _typed_text_payload(id_index, "disp-formula", "formula", rid)
     if rtype == "app" and rid:
-        return _typed_text_payload(
-            paper_root, f"//app[@id='{rid}']", "appendix", rid, max_chars=200
-        )
+        return _typed_text_payload(id_index, "app", "appendix", rid, max_chars=200)
     if rtype == "sec" and rid:
-        return _section_payload(paper_root, rid)
+        return _section_payload(id_index, rid)
     if rtype == "boxed-text" and rid:
         return _typed_text_payload(
-            paper_root, f"//boxed-text[@id='{rid}']", "boxed-text", rid, max_chars=200
+            id_index, "boxed-text", "boxed-text", rid, max_chars=200
         )
     if rtype == "scheme" and rid:
-        return _typed_text_payload(
-            paper_root, f"//*[@id='{rid}']", "scheme", rid, max_chars=200
-        )
+        return _typed_text_payload(id_index, None, "scheme", rid, max_chars=200)
     if rtype and rid:
-        return _typed_text_payload(
-            paper_root, f"//*[@id='{rid}']", rtype, rid, max_chars=200
-        )
+        return _typed_text_payload(id_index, None, rtype, rid, max_chars=200)
     return None
 
 
 def _resolve_citation_xref(
-    paper_root: ET.Element, rid: str | None
+    id_index: _IdIndex, rid: str | None, parsed_citations: _CitationCache
 ) -> dict[str, Any] | str | None:
     """Resolve a bibliographic xref or warn when it cannot be resolved."""
     if not rid:
@@ -704,27 +830,41 @@ def _resolve_citation_xref(
             stacklevel=2,
         )
         return None
-    matches = paper_root.xpath(f"//ref[@id='{rid}']")
-    if not matches:
+    ref = id_index.get(("ref", rid))
+    if ref is None:
         warnings.warn("Citation id not found", UnmatchedCitationWarning, stacklevel=2)
         return None
-    return _parse_citation(matches[0])
+    return _cached_citation(parsed_citations, ref)
 
 
-def _resolve_table_xref(paper_root: ET.Element, rid: str | None) -> TextTable | None:
+def _cached_citation(
+    parsed_citations: _CitationCache, ref: ET.Element
+) -> dict[str, Any] | str:
+    """Return ``_parse_citation(ref)``, parsing each ``<ref>`` at most once.
+
+    Keys are the elements themselves, which the cache keeps alive, so a key
+    cannot be reused by another element while the tree is being processed.
+    """
+    citation = parsed_citations.get(ref)
+    if citation is None:
+        citation = parsed_citations[ref] = _parse_citation(ref)
+    return citation
+
+
+def _resolve_table_xref(id_index: _IdIndex, rid: str | None) -> TextTable | None:
     """Resolve a table xref or warn when the xref has no target id."""
     if not rid:
         warnings.warn("Table ref without id", UnmatchedTableWarning, stacklevel=2)
         return None
-    return _first_mapped(paper_root, f"//table-wrap[@id='{rid}']", TextTable)
+    return _first_mapped(id_index, "table-wrap", rid, TextTable)
 
 
 def _first_mapped(
-    paper_root: ET.Element, xpath: str, factory: Callable[[Any], Any]
+    id_index: _IdIndex, tag: str, rid: str, factory: Callable[[Any], Any]
 ) -> Any | None:
-    """Map the first XPath match through ``factory`` if present."""
-    matches = paper_root.xpath(xpath)
-    return factory(matches[0]) if matches else None
+    """Map the ``<tag id=rid>`` element through ``factory`` if present."""
+    target = id_index.get((tag, rid))
+    return factory(target) if target is not None else None
 
 
 def _first_text(paper_root: ET.Element, xpath: str) -> str | None:
@@ -732,19 +872,25 @@ def _first_text(paper_root: ET.Element, xpath: str) -> str | None:
     matches = paper_root.xpath(xpath)
     if not matches:
         return None
-    return "".join(matches[0].itertext()).strip()
+    return text_content(matches[0])
+
+
+def _target_text(id_index: _IdIndex, tag: str | None, rid: str) -> str | None:
+    """Return the stripped text of the ``xref`` target, if present."""
+    target = id_index.get((tag, rid))
+    return text_content(target) if target is not None else None
 
 
 def _typed_text_payload(
-    paper_root: ET.Element,
-    xpath: str,
+    id_index: _IdIndex,
+    tag: str | None,
     payload_type: str,
     rid: str,
     *,
     max_chars: int | None = None,
 ) -> dict[str, str] | None:
     """Return a typed text payload for an ``xref`` target."""
-    text = _first_text(paper_root, xpath)
+    text = _target_text(id_index, tag, rid)
     if text is None:
         return None
     if max_chars is not None:
@@ -752,16 +898,16 @@ def _typed_text_payload(
     return {"type": payload_type, "id": rid, "text": text}
 
 
-def _section_payload(paper_root: ET.Element, rid: str) -> dict[str, str] | None:
+def _section_payload(id_index: _IdIndex, rid: str) -> dict[str, str] | None:
     """Return the section title payload for a section xref."""
-    matches = paper_root.xpath(f"//sec[@id='{rid}']")
-    if not matches:
+    section = id_index.get(("sec", rid))
+    if section is None:
         return None
-    title = matches[0].find("title")
+    title = section.find("title")
     return {
         "type": "section",
         "id": rid,
-        "title": "".join(title.itertext()).strip() if title is not None else "",
+        "title": text_content(title) if title is not None else "",
     }
 
 
@@ -801,40 +947,6 @@ def _get_ref_type(value: Any) -> str:
     return "citation"
 
 
-def _split_citations_tables_figs(
-    ref_map: BasicBiMap,
-) -> tuple[list[Any], list[Any], list[Any]]:
-    """Categorize references from reference map into citations, tables, and figures.
-
-    Processes all items in the reference map and separates them into different
-    categories based on their type and content. This enables type-specific
-    processing and output formatting.
-
-    Args:
-        ref_map: Bidirectional map containing resolved reference objects
-
-    Returns:
-        tuple[list, list, list]: A tuple containing:
-            - citations: List of citation dictionaries
-            - tables: List of pandas DataFrames from resolved tables
-            - figures: List of figure dictionaries with metadata
-
-    Examples:
-        >>> citations, tables, figures = _split_citations_tables_figs(ref_map)
-        >>> print(f"Found {len(citations)} citations, {len(tables)} tables, {len(figures)} figures")
-    """
-    citations, tables, figures = [], [], []
-    for item in ref_map.values():
-        rtype = _get_ref_type(item)
-        if rtype == "citation":
-            citations.append(item)
-        elif rtype == "table" and hasattr(item, "df"):
-            tables.append(item.df)
-        elif rtype == "fig":
-            figures.append(item if isinstance(item, dict) else item.fig_dict)
-    return citations, tables, figures
-
-
 _MHTML_REF_RE = re.compile(r"\[MHTML::DATAREF::(?P<key>\d+)\]")
 _XML_NS = "http://www.w3.org/XML/1998/namespace"
 _XLINK_NS = "http://www.w3.org/1999/xlink"
@@ -889,11 +1001,15 @@ def _direct_text(element: ET.Element, tag: str) -> str:
     return _element_text(child)
 
 
-def _all_reference_records(root: ET.Element) -> list[dict[str, Any]]:
+def _all_reference_records(
+    root: ET.Element, parsed_citations: _CitationCache | None = None
+) -> list[dict[str, Any]]:
     """Return every bibliography entry under back matter, cited or not."""
+    if parsed_citations is None:
+        parsed_citations = {}
     records: list[dict[str, Any]] = []
-    for index, ref in enumerate(root.xpath("//back//ref"), start=1):
-        citation = _parse_citation(ref)
+    for index, ref in enumerate(_BACK_REF_XPATH(root), start=1):
+        citation = _cached_citation(parsed_citations, ref)
         records.append(
             {
                 "id": ref.get("id") or f"ref_{index}",
@@ -909,7 +1025,7 @@ def _all_reference_records(root: ET.Element) -> list[dict[str, Any]]:
 def _all_abstract_records(root: ET.Element) -> list[dict[str, Any]]:
     """Return all abstract variants present in article metadata."""
     records: list[dict[str, Any]] = []
-    for index, abstract in enumerate(root.xpath("//article-meta/abstract"), start=1):
+    for index, abstract in enumerate(_ABSTRACT_XPATH(root), start=1):
         abstract_type = abstract.get("abstract-type") or "primary"
         records.append(
             {
@@ -924,7 +1040,8 @@ def _all_abstract_records(root: ET.Element) -> list[dict[str, Any]]:
                 "source": _source_record(abstract, ordinal=index),
             }
         )
-    for index, abstract in enumerate(root.xpath("//trans-abstract"), start=1):
+    trans_abstracts = root.getroottree().iter("trans-abstract")
+    for index, abstract in enumerate(trans_abstracts, start=1):
         records.append(
             {
                 "id": abstract.get("id") or f"translated_abstract_{index}",
@@ -945,7 +1062,7 @@ def _abstract_title(abstract: ET.Element, *, default: str) -> str:
     title = abstract.find("title")
     if title is None:
         return default
-    return "".join(title.itertext()).strip() or default
+    return text_content(title) or default
 
 
 def _xml_lang(element: ET.Element) -> str:
@@ -983,7 +1100,7 @@ def _abstract_blocks(abstract: ET.Element) -> list[dict[str, Any]]:
 def _article_id_records(root: ET.Element) -> list[dict[str, Any]]:
     """Return all article IDs with type and source metadata."""
     records = []
-    for index, element in enumerate(root.xpath("//article-meta/article-id"), start=1):
+    for index, element in enumerate(_ARTICLE_ID_XPATH(root), start=1):
         records.append(
             {
                 "id": f"article_id_{index}",
@@ -998,7 +1115,7 @@ def _article_id_records(root: ET.Element) -> list[dict[str, Any]]:
 def _title_records(root: ET.Element) -> list[dict[str, Any]]:
     """Return main, subtitle, and translated article title records."""
     records: list[dict[str, Any]] = []
-    title_group = root.xpath("//article-meta/title-group")
+    title_group = _TITLE_GROUP_XPATH(root)
     if not title_group:
         return records
     ordinal = 0
@@ -1032,7 +1149,7 @@ def _title_records(root: ET.Element) -> list[dict[str, Any]]:
 def _keyword_group_records(root: ET.Element) -> list[dict[str, Any]]:
     """Return all keyword groups instead of flattening them into one list."""
     groups = []
-    for index, group in enumerate(root.xpath("//article-meta/kwd-group"), start=1):
+    for index, group in enumerate(_KWD_GROUP_XPATH(root), start=1):
         keywords = []
         for keyword_index, kwd in enumerate(group.xpath("kwd"), start=1):
             keywords.append(
@@ -1057,9 +1174,7 @@ def _keyword_group_records(root: ET.Element) -> list[dict[str, Any]]:
 def _subject_group_records(root: ET.Element) -> list[dict[str, Any]]:
     """Return article-category subject groups with hierarchy preserved."""
     records = []
-    for index, group in enumerate(
-        root.xpath("//article-meta/article-categories//subj-group"), start=1
-    ):
+    for index, group in enumerate(_SUBJ_GROUP_XPATH(root), start=1):
         records.append(
             {
                 "id": group.get("id") or f"subject_group_{index}",
@@ -1081,7 +1196,7 @@ def _affiliation_records(root: ET.Element) -> list[dict[str, Any]]:
     """Return canonical affiliation records from article metadata."""
     records = []
     seen_paths: set[str] = set()
-    for index, aff in enumerate(root.xpath("//article-meta//aff"), start=1):
+    for index, aff in enumerate(_AFF_XPATH(root), start=1):
         source = _source_record(aff, ordinal=index)
         path = str(source.get("path", ""))
         if path in seen_paths:
@@ -1128,7 +1243,7 @@ def _affiliation_records(root: ET.Element) -> list[dict[str, Any]]:
 def _contributor_records(root: ET.Element) -> list[dict[str, Any]]:
     """Return all contributor records with IDs, names, emails, and aff links."""
     records = []
-    for index, contrib in enumerate(root.xpath("//article-meta//contrib"), start=1):
+    for index, contrib in enumerate(_CONTRIB_XPATH(root), start=1):
         given = _direct_text(contrib, ".//given-names")
         surname = _direct_text(contrib, ".//surname")
         collab = _direct_text(contrib, ".//collab")
@@ -1201,9 +1316,7 @@ def _contributor_affiliation_links(
 def _license_records(root: ET.Element) -> list[dict[str, Any]]:
     """Return every license record with href and full text."""
     records = []
-    for index, license_el in enumerate(
-        root.xpath("//article-meta/permissions/license"), start=1
-    ):
+    for index, license_el in enumerate(_LICENSE_XPATH(root), start=1):
         href = license_el.get(f"{{{_XLINK_NS}}}href") or license_el.get("xlink:href")
         records.append(
             {
@@ -1220,17 +1333,17 @@ def _license_records(root: ET.Element) -> list[dict[str, Any]]:
 def _date_records(root: ET.Element) -> dict[str, Any]:
     """Extract date values without inventing missing precision."""
     published: dict[str, dict[str, str]] = {}
-    for date_el in root.xpath("//article-meta/pub-date"):
+    for date_el in _PUB_DATE_XPATH(root):
         date_type = date_el.get("pub-type") or date_el.get("date-type") or "unknown"
         published[date_type] = _date_record(date_el)
 
     history: dict[str, dict[str, str]] = {}
-    for date_el in root.xpath("//article-meta/history/date"):
+    for date_el in _HISTORY_DATE_XPATH(root):
         date_type = date_el.get("date-type") or "unknown"
         history[date_type] = _date_record(date_el)
 
     version_history = []
-    for version_el in root.xpath("//article-meta/article-version"):
+    for version_el in _ARTICLE_VERSION_XPATH(root):
         date_el = version_el.find("date")
         version_history.append(
             {
@@ -1301,6 +1414,7 @@ def _reference_links(
     """Extract inline reference positions from marked paragraph text."""
     links: list[dict[str, Any]] = []
     known_ref_ids = {record["id"] for record in references if record.get("id")}
+    document_ids = _document_ids(root)
     for context, elements in (("abstract", abstract), ("body", body)):
         for paragraph, section in _iter_paragraphs(elements):
             marked = getattr(paragraph, "text_with_refs", "")
@@ -1310,7 +1424,6 @@ def _reference_links(
                 key = int(match.group("key"))
                 raw_ref = ref_map.get(key)
                 link = _link_record(
-                    root,
                     raw_ref,
                     key=key,
                     ordinal=len(links) + 1,
@@ -1320,6 +1433,7 @@ def _reference_links(
                     marked_text=marked,
                     marker=match,
                     known_ref_ids=known_ref_ids,
+                    document_ids=document_ids,
                 )
                 if link is not None:
                     links.append(link)
@@ -1340,7 +1454,6 @@ def _iter_paragraphs(
 
 
 def _link_record(
-    root: ET.Element,
     raw_ref: Any,
     *,
     key: int,
@@ -1351,6 +1464,7 @@ def _link_record(
     marked_text: str,
     marker: re.Match[str],
     known_ref_ids: set[str],
+    document_ids: set[str],
 ) -> dict[str, Any] | None:
     """Build one structured link record from a ref-map marker."""
     if not isinstance(raw_ref, str):
@@ -1363,10 +1477,10 @@ def _link_record(
     target_ids = [rid for rid in (ref_el.get("rid") or "").split() if rid]
     link_type = _v3_link_type(ref_type)
     before_marker = _MHTML_REF_RE.sub("", marked_text[: marker.start()])
-    inline_text = "".join(ref_el.itertext()).strip()
+    inline_text = text_content(ref_el)
     char_start = len(before_marker)
     char_end = char_start + len(inline_text)
-    resolved = _targets_resolved(root, link_type, target_ids, known_ref_ids)
+    resolved = _targets_resolved(link_type, target_ids, known_ref_ids, document_ids)
     section_root = getattr(section, "root", None)
     return {
         "id": f"link_{ordinal}",
@@ -1399,14 +1513,26 @@ def _v3_link_type(ref_type: str) -> str:
     }.get(ref_type, ref_type or "reference")
 
 
+def _document_ids(root: ET.Element) -> set[str]:
+    """Return every ``id`` attribute value in the document, in one walk."""
+    ids: set[str] = set()
+    for element in root.getroottree().iter(ET.Element):
+        element_id = element.get("id")
+        if element_id:
+            ids.add(element_id)
+    return ids
+
+
 def _targets_resolved(
-    root: ET.Element, link_type: str, target_ids: list[str], known_ref_ids: set[str]
+    link_type: str,
+    target_ids: list[str],
+    known_ref_ids: set[str],
+    document_ids: set[str],
 ) -> bool:
     if not target_ids:
         return False
-    if link_type == "citation":
-        return all(target_id in known_ref_ids for target_id in target_ids)
-    return all(bool(root.xpath(f"//*[@id='{target_id}']")) for target_id in target_ids)
+    known = known_ref_ids if link_type == "citation" else document_ids
+    return all(target_id in known for target_id in target_ids)
 
 
 def _missing_diagnostics(d: dict[str, Any]) -> list[dict[str, str]]:
@@ -1519,8 +1645,7 @@ def paper_dict_from_pmc(
         logger.info("Generating Paper object for PMCID=%s …", pmcid)
     try:
         if suppress_warnings:
-            with warnings.catch_warnings():
-                warnings.simplefilter("ignore")
+            with warnings_suppressed():
                 tree = get_xml(pmcid, email, download, validate, verbose=verbose)
         else:
             tree = get_xml(pmcid, email, download, validate, verbose=verbose)
@@ -1642,14 +1767,38 @@ def generate_paper_dict(
         >>> if article:  # Check if parsing succeeded
         ...     process_article(article)
     """
+    if not suppress_warnings:
+        return _build_or_empty(pmcid, root, verbose, suppress_errors)
+    with warnings_suppressed():
+        return _build_or_empty(pmcid, root, verbose, suppress_errors)
+
+
+def _build_or_empty(
+    pmcid: int, root: ET.Element, verbose: bool, suppress_errors: bool
+) -> dict[str, Any]:
+    """Build the paper dict, or return {} on error if errors are suppressed."""
+    try:
+        return build_complete_paper_dict(pmcid, root, verbose)
+    except Exception as exc:
+        return {} if suppress_errors else (_raise(exc))
+
+
+@contextmanager
+def warnings_suppressed() -> Iterator[None]:
+    """Ignore all warnings raised inside the block.
+
+    ``suppress_warnings=True`` installs and removes a warnings filter on
+    every call, and the filter list is process-global state guarded by a
+    lock. For batches, wrap the whole loop once and leave
+    ``suppress_warnings`` off for the individual articles.
+
+    Examples:
+        >>> with warnings_suppressed():
+        ...     papers = [paper_dict_from_local_xml(p) for p in paths]
+    """
     with warnings.catch_warnings():
-        if suppress_warnings:
-            warnings.simplefilter("ignore")
-        try:
-            data = build_complete_paper_dict(pmcid, root, verbose)
-        except Exception as exc:
-            data = {} if suppress_errors else (_raise(exc))
-    return data
+        warnings.simplefilter("ignore")
+        yield
 
 
 def _raise(exc: Exception) -> NoReturn:
@@ -1686,6 +1835,8 @@ def build_complete_paper_dict(
         pmcid: PubMed Central ID for identification and logging
         root: Root element of the PMC article XML document
         verbose: If True, emit progress logging messages
+        include_ref_map_with_tags: If True, keep a snapshot of the raw
+            reference tags under "Ref Map With Tags" (empty otherwise)
 
     Returns:
         dict[str, Any]: Complete article dictionary containing:
@@ -1787,22 +1938,24 @@ def build_complete_paper_dict(
         "TeX Equations": _safe(gather_tex_equations, root),
     }
 
-    # Only deep-copy the ref_map when explicitly requested (expensive operation)
+    # Only snapshot the ref_map when explicitly requested. Its values are
+    # immutable tag strings, so a shallow copy is as safe as a deep one.
     if include_ref_map_with_tags:
-        import copy
-
-        d["Ref Map With Tags"] = copy.deepcopy(ref_map)
+        d["Ref Map With Tags"] = BasicBiMap(ref_map)
     else:
         d["Ref Map With Tags"] = BasicBiMap()
 
     diagnostics.extend(_missing_diagnostics(d))
 
-    d["Ref Map"] = process_reference_map(root, ref_map)
-
-    citations, tables, figures = _split_citations_tables_figs(d["Ref Map"])
+    # Cited refs are parsed while resolving the map; the full reference list
+    # below reuses those results instead of parsing every <ref> again.
+    parsed_citations: _CitationCache = {}
+    d["Ref Map"], citations, tables, figures = _resolve_reference_map(
+        root, ref_map, parsed_citations
+    )
     v4_records = _jats_records.extract_v4_records(root)
     all_abstracts = v4_records["abstracts"] or _all_abstract_records(root)
-    all_references = _all_reference_records(root)
+    all_references = _all_reference_records(root, parsed_citations)
     links = v4_records["links"] or _reference_links(
         root,
         d.get("Abstract"),
@@ -21,6 +21,8 @@ Note:
 
 # normalize_value is imported from common.serialization below
 
+from functools import cache
+
 from pmcgrab.common.serialization import clean_doc
 
 
@@ -47,8 +49,15 @@ def define_data_dict() -> dict[str, str]:
     Note:
         This function is used internally by the Paper class to populate
         the data_dict attribute, providing self-documenting capabilities
-        for Paper instances.
+        for Paper instances. The documentation strings are built once and
+        each call returns a fresh copy, so callers may modify the result.
     """
+    return dict(_data_dict())
+
+
+@cache
+def _data_dict() -> dict[str, str]:
+    """Build the field documentation mapping returned by define_data_dict."""
     return {
         "PMCID": "PMCID of the PMC article. Unique.",
         "Title": "Title of the PMC article.",
@@ -76,6 +76,24 @@ class TestApplicationPaperBuilder:
         assert isinstance(paper, Paper)
         assert mock_sleep.call_count == 2  # Sleep called twice for retries
 
+    @patch("pmcgrab.application.paper_builder.paper_dict_from_pmc")
+    @patch("pmcgrab.application.paper_builder.time.sleep")
+    def test_build_paper_from_pmc_backoff(self, mock_sleep, mock_paper_dict):
+        """Test retries back off exponentially and skip the final sleep."""
+        from urllib.error import HTTPError
+
+        mock_paper_dict.side_effect = HTTPError(
+            url="test", code=503, msg="Unavailable", hdrs=None, fp=None
+        )
+
+        paper = build_paper_from_pmc(12345, email="test@example.com", attempts=4)
+
+        assert paper is None
+        delays = [call.args[0] for call in mock_sleep.call_args_list]
+        assert len(delays) == 3
+        for retry, delay in enumerate(delays):
+            assert 2**retry / 2 <= delay <= 2**retry
+
     @patch("pmcgrab.application.paper_builder.paper_dict_from_pmc")
     def test_build_paper_from_pmc_returns_none(self, mock_paper_dict):
         """Test paper building returns None when dict is None."""
@@ -495,6 +513,27 @@ class TestHttpUtilsEdgeCases:
         result = cached_get("http://example-cached-test2.com", params={})
         assert result == mock_response
 
+    @patch("pmcgrab.http_utils._session")
+    def test_cached_get_without_cache(self, mock_session):
+        """Test cache=False neither reads nor stores cached responses."""
+        from pmcgrab.http_utils import _CACHE
+
+        _CACHE.clear()
+        mock_session.get.return_value = MagicMock()
+
+        cached_get("http://example-uncached.com", params={"a": 1}, cache=False)
+        cached_get("http://example-uncached.com", params={"a": 1}, cache=False)
+
+        assert mock_session.get.call_count == 2
+        assert not _CACHE
+
+    def test_session_pool_covers_batch_workers(self):
+        """Test the shared session keeps enough idle connections per host."""
+        from pmcgrab.http_utils import _session
+
+        adapter = _session.get_adapter("https://www.ncbi.nlm.nih.gov/")
+        assert adapter._pool_maxsize >= 16
+
 
 class TestModelEdgeCases:
     """Test model classes with edge cases."""
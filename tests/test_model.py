@@ -1,11 +1,16 @@
 """Tests for pmcgrab.model module."""
 
+import copy
+import warnings
+
 import lxml.etree as ET
 import pandas as pd
+import pytest
 
+from pmcgrab.constants import ReadHTMLFailure
 from pmcgrab.domain.value_objects import BasicBiMap
 from pmcgrab.figure import TextFigure
-from pmcgrab.model import Paper, TextParagraph, TextSection, TextTable
+from pmcgrab.model import Paper, TextParagraph, TextSection, TextTable, _indent
 
 
 class TestPaper:
@@ -27,6 +32,33 @@ class TestPaper:
         assert paper.abstract is None
         assert paper.body is None
 
+    def test_paper_aliases_and_permissions(self):
+        """Test derived attributes set after the field copy."""
+        paper = Paper(
+            {
+                "PMCID": 1,
+                "FPage": "10",
+                "LPage": "20",
+                "Supplementary Material": ["s1"],
+                "Ref Map With Tags": {0: "<xref/>"},
+                "Permissions": {"Copyright Statement": "(c)", "License Type": "CC"},
+            }
+        )
+        assert (paper.first_page, paper.last_page) == ("10", "20")
+        assert paper.supplementary == ["s1"]
+        assert paper._ref_map_with_tags == {0: "<xref/>"}
+        assert (paper.copyright, paper.license) == ("(c)", "CC")
+        assert paper.diagnostics is None
+
+    def test_paper_accepts_user_attributes(self):
+        """Test Paper stays open for caller-attached attributes and still copies."""
+        paper = Paper({"PMCID": 1, "Title": "T", "Permissions": {"License Type": "CC"}})
+        paper.note = "user data"
+        assert paper.note == "user data"
+        clone = copy.deepcopy(paper)
+        assert (clone.pmcid, clone.title, clone.license) == (1, "T", "CC")
+        assert clone.data_dict == paper.data_dict
+
     def test_paper_from_builder_with_mock(self, monkeypatch):
         """Test building Paper with mocked dependencies."""
 
@@ -54,6 +86,31 @@ class TestPaper:
         assert paper.title == "Test Title"
         assert paper.journal_title == "Test Journal"
 
+    def test_paper_from_pmcs_preserves_order(self, monkeypatch):
+        """Test batch construction keeps input order and forwards options."""
+        from pmcgrab import parser
+
+        calls = []
+
+        def mock_paper_dict_from_pmc(pmcid, **kwargs):
+            calls.append((pmcid, kwargs["email"], kwargs["suppress_errors"]))
+            return {"PMCID": pmcid, "Title": f"Paper {pmcid}"}
+
+        monkeypatch.setattr(parser, "paper_dict_from_pmc", mock_paper_dict_from_pmc)
+
+        papers = Paper.from_pmcs(
+            ["PMC3", 1, "2"],
+            email="test@example.com",
+            max_workers=2,
+            suppress_errors=True,
+        )
+        assert [paper.pmcid for paper in papers] == [3, 1, 2]
+        assert sorted(calls) == [
+            (1, "test@example.com", True),
+            (2, "test@example.com", True),
+            (3, "test@example.com", True),
+        ]
+
     def test_paper_has_data_property(self):
         """Test the has_data property."""
         # Empty dict should result in no data
@@ -115,6 +172,116 @@ class TestTextSection:
         assert "Test" in str_repr
         assert "Content" in str_repr
 
+    def test_nested_sections_keep_document_order(self):
+        """Test nested sections are built in document order with post-order text."""
+        xml = """<sec>
+            <title>Outer</title>
+            <p>First <xref ref-type="bibr" rid="r1">1</xref></p>
+            <sec>
+                <title>Inner</title>
+                <p>Second <xref ref-type="bibr" rid="r2">2</xref></p>
+                <sec><p>Third <xref ref-type="bibr" rid="r3">3</xref></p></sec>
+            </sec>
+            <p>Fourth <xref ref-type="bibr" rid="r4">4</xref></p>
+        </sec>"""
+        ref_map = BasicBiMap()
+        section = TextSection(ET.fromstring(xml), ref_map=ref_map)
+
+        inner = section.children[1]
+        assert isinstance(section.children, tuple)
+        assert isinstance(inner, TextSection)
+        assert isinstance(inner.children, tuple)
+        assert inner.parent is section
+        assert inner.title == "Inner"
+        assert isinstance(inner.children[1], TextSection)
+        assert "Third" in inner.text
+        assert "Third" in section.text
+        rids = [ET.fromstring(ref_map[i]).get("rid") for i in range(len(ref_map))]
+        assert rids == ["r1", "r2", "r3", "r4"]
+
+    def test_nested_section_text_indentation(self):
+        """Test each nesting level adds one indent and blank lines stay bare."""
+        xml = """<sec><title>A</title><p>One</p><sec><title>B</title>
+            <p>Two\n\nlines</p></sec></sec>"""
+        section = TextSection(ET.fromstring(xml))
+
+        assert str(section) == (
+            "SECTION: A:\n\n    One\n\n    SECTION: B:\n\n"
+            "        Two\n\n        lines\n\n"
+        )
+        assert section.get_section_text_with_refs() == (
+            "SECTION: A:\n\nOne\n\n    SECTION: B:\n\n    Two\n\n    lines\n\n"
+        )
+
+    def test_text_section_equality(self):
+        """Test sections compare by title and children, not identity."""
+        xml = "<sec><title>T</title><p>One.</p><sec><p>Two.</p></sec></sec>"
+        first = TextSection(ET.fromstring(xml))
+        second = TextSection(ET.fromstring(xml))
+        changed = TextSection(ET.fromstring(xml.replace("Two.", "Three.")))
+        retitled = TextSection(ET.fromstring(xml.replace(">T<", ">U<")))
+
+        assert first == second
+        assert first != changed
+        assert first != retitled
+        assert first != "T"
+
+    def test_section_text_rendered_lazily(self, monkeypatch):
+        """Test section text is rendered once, on first access."""
+        calls = []
+        render = TextSection.get_section_text
+
+        def counting_render(self):
+            calls.append(self.title)
+            return render(self)
+
+        monkeypatch.setattr(TextSection, "get_section_text", counting_render)
+        xml = "<sec><title>Outer</title><sec><title>Inner</title><p>x</p></sec></sec>"
+        section = TextSection(ET.fromstring(xml))
+        assert calls == []
+
+        assert "Inner" in section.text
+        assert section.text == str(section)
+        assert calls == ["Outer"]
+
+    def test_ref_map_shared_through_hierarchy(self):
+        """Test nested elements resolve and replace the root's ref map."""
+        ref_map = BasicBiMap()
+        section = TextSection(
+            ET.fromstring("<sec><sec><p>Deep.</p></sec></sec>"), ref_map=ref_map
+        )
+        paragraph = section.children[0].children[0]
+        assert paragraph.get_ref_map() is ref_map
+
+        replacement = BasicBiMap()
+        paragraph.set_ref_map(replacement)
+        assert section.ref_map is replacement
+        assert section.children[0].get_ref_map() is replacement
+
+    def test_indent_matches_textwrap(self):
+        """Test the inlined indent helper agrees with textwrap.indent."""
+        import textwrap
+
+        samples = ["", "one", "a\n\nb\n", "  \n x \r\ny\x0cz\u2028w", "\n\t\n"]
+        for text in samples:
+            assert _indent(text, "    ") == textwrap.indent(text, "    ")
+
+    def test_section_ignores_comments_and_processing_instructions(self):
+        """Test comments and PIs between section children add no text."""
+        xml = """<sec>
+            <title>Methods</title>
+            <!-- editorial note -->
+            <p>Body text.</p>
+            <?page-break?>
+            <sec><!-- nested note --><p>Nested text.</p></sec>
+        </sec>"""
+        section = TextSection(ET.fromstring(xml))
+
+        assert len(section.children) == 2
+        assert "editorial note" not in section.text
+        assert "nested note" not in section.text
+        assert "Nested text." in section.text
+
 
 class TestTextParagraph:
     """Test the TextParagraph class."""
@@ -138,6 +305,46 @@ class TestTextParagraph:
         # Should handle the reference gracefully
         assert isinstance(str(paragraph), str)
 
+    def test_text_paragraph_equality_and_hash(self):
+        """Test equal paragraphs hash alike and deduplicate in a set."""
+        first = TextParagraph(ET.fromstring("<p>Same text.</p>"))
+        second = TextParagraph(ET.fromstring("<p>Same text.</p>"))
+        other = TextParagraph(ET.fromstring("<p>Other text.</p>"))
+
+        assert first == second
+        assert first != other
+        assert first != "Same text."
+        assert hash(first) == hash(second)
+        assert len({first, second, other}) == 2
+
+    def test_text_elements_use_slots(self):
+        """Test text elements carry no per-instance __dict__ and still copy."""
+        section = TextSection(
+            ET.fromstring(
+                "<sec><title>T</title><p>Text.</p>"
+                "<table-wrap><table><tr><td>1</td></tr></table></table-wrap></sec>"
+            )
+        )
+        paragraph, table = section.children
+
+        for element in (section, paragraph, table):
+            assert not hasattr(element, "__dict__")
+        assert copy.deepcopy(paragraph) == paragraph
+        assert copy.deepcopy(section).text == section.text
+
+    def test_text_paragraph_from_text_matches_wrapped_element(self):
+        """Test from_text gives the same result as a synthetic <p> element."""
+        text = "  Rendered <bold>block</bold> text\n- item  "
+        synth = ET.Element("p")
+        synth.text = text
+
+        wrapped = TextParagraph(synth, ref_map=BasicBiMap())
+        direct = TextParagraph.from_text(text, ref_map=BasicBiMap())
+        assert direct.text == wrapped.text
+        assert direct.text_with_refs == wrapped.text_with_refs
+        assert direct.id is None
+        assert direct.root is None
+
 
 class TestTextTable:
     """Test the TextTable class."""
@@ -179,6 +386,72 @@ class TestTextTable:
         # Just check it was created successfully
         assert isinstance(table, TextTable)
 
+    def test_text_table_label_and_caption_first_text_nodes(self):
+        """Test label/caption keep the first direct text node as plain str."""
+        xml = """<table-wrap>
+            <label><!-- note -->Table <bold>3</bold></label>
+            <caption><title>Ignored</title><p><italic>Lead</italic> tail</p></caption>
+            <table><tr><td>1</td></tr></table>
+        </table-wrap>"""
+        element = ET.fromstring(xml)
+        table = TextTable(element)
+
+        assert table.label == element.xpath("label/text()")[0] == "Table "
+        assert table.caption == element.xpath("caption/p/text()")[0] == " tail"
+        assert type(table.label) is str
+        assert type(table.caption) is str
+
+    def test_text_table_empty_table_warns_at_construction(self):
+        """Test an empty <table> reports ReadHTMLFailure while being built."""
+        xml = "<table-wrap><table></table></table-wrap>"
+        with pytest.warns(ReadHTMLFailure):
+            table = TextTable(ET.fromstring(xml))
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            assert table.df is None
+            assert str(table) == "Table could not be parsed"
+
+    def test_text_table_direct_parse_matches_read_html(self):
+        """Test plain tables built from lxml match pandas.read_html exactly."""
+        from io import StringIO
+
+        xml = """<table-wrap id="table1">
+            <table>
+                <tr><th>Name</th><th>Count</th><th></th></tr>
+                <tr><td><bold>a</bold>  b</td><td>1,000</td><td>0.5</td></tr>
+                <tr><td>c\nd</td><td></td></tr>
+            </table>
+        </table-wrap>"""
+        element = ET.fromstring(xml)
+        markup = ET.tostring(element, encoding="unicode")
+        expected = pd.read_html(StringIO(markup))[0]
+
+        table = TextTable(element)
+        pd.testing.assert_frame_equal(table.df, expected)
+
+    def test_text_table_spanned_cells_match_read_html_of_wrap(self):
+        """Test the read_html path ignores caption and footnote markup."""
+        from io import StringIO
+
+        xml = """<table-wrap id="table2">
+            <label>Table 2</label>
+            <caption><p>Spanned <bold>header</bold></p></caption>
+            <table>
+                <thead><tr><th colspan="2">Group</th></tr>
+                <tr><th>A</th><th>B</th></tr></thead>
+                <tbody><tr><td>1</td><td>x</td></tr></tbody>
+            </table>
+            <table-wrap-foot><fn><p>Note 3 4</p></fn></table-wrap-foot>
+        </table-wrap>"""
+        element = ET.fromstring(xml)
+        markup = ET.tostring(element, encoding="unicode")
+        expected = pd.read_html(StringIO(markup))[0]
+
+        table = TextTable(element)
+        assert table.table_dict["columns"] == ["Group / A", "Group / B"]
+        assert table.table_dict["rows"] == expected.values.tolist()
+        assert table.footnotes == ["Note 3 4"]
+
 
 class TestTextFigure:
     """Test the TextFigure class."""
@@ -0,0 +1,123 @@
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from pmcgrab import oa_service
+
+
+@pytest.fixture(autouse=True)
+def _clear_fetch_cache():
+    oa_service._fetch_record.cache_clear()
+    yield
+    oa_service._fetch_record.cache_clear()
+
+
+_OA_RESPONSE = b"""<?xml version="1.0" encoding="UTF-8"?>
+<OA>
+  <responseDate>2024-01-01 00:00:00</responseDate>
+  <records returned-count="1" total-count="1">
+    <record id="PMC7181753" citation="Commun Biol. 2020" license="CC BY">
+      <!-- package links -->
+      <link format="tgz" updated="2020-04-23 12:00:00"
+            href="ftp://ftp.ncbi.nlm.nih.gov/pub/pmc/oa_package/aa/bb/PMC7181753.tar.gz"/>
+      <link format="pdf" updated="2020-04-23 12:00:00"
+            href="ftp://ftp.ncbi.nlm.nih.gov/pub/pmc/oa_pdf/aa/bb/main.pdf"/>
+    </record>
+  </records>
+</OA>
+"""
+
+
+def test_fetch_parses_first_record():
+    with patch("pmcgrab.oa_service.cached_get") as mock_get:
+        mock_get.return_value = SimpleNamespace(content=_OA_RESPONSE)
+
+        result = oa_service.fetch("PMC7181753")
+
+    assert result == {
+        "id": "PMC7181753",
+        "citation": "Commun Biol. 2020",
+        "license": "CC BY",
+        "link": "",
+    }
+    assert mock_get.call_args.kwargs["params"] == {"id": "PMC7181753"}
+
+
+def test_fetch_returns_none_without_record():
+    with patch("pmcgrab.oa_service.cached_get") as mock_get:
+        mock_get.return_value = SimpleNamespace(
+            content=b'<OA><error code="idDoesNotExist">bad id</error></OA>'
+        )
+
+        assert oa_service.fetch("PMC0") is None
+
+
+def test_list_oa_links_preserves_every_link():
+    with patch("pmcgrab.oa_service.cached_get") as mock_get:
+        mock_get.return_value = SimpleNamespace(content=_OA_RESPONSE)
+
+        links = oa_service.list_oa_links("PMC7181753")
+
+    assert [link["format"] for link in links] == ["tgz", "pdf"]
+    assert all(link["href"].startswith("ftp://") for link in links)
+
+
+def test_fetch_stops_at_first_record_of_batched_reply():
+    content = (
+        b'<OA><records><record id="PMC1"><link href="a"/></record>'
+        b'<record id="PMC2"/><unclosed></records></OA>'
+    )
+    with patch("pmcgrab.oa_service.cached_get") as mock_get:
+        mock_get.return_value = SimpleNamespace(content=content)
+
+        assert oa_service.fetch("PMC1") == {"id": "PMC1", "link": ""}
+
+
+def test_fetch_accepts_root_level_record_and_ignores_nested_ones():
+    content = b'<OA><error><record id="nested"/></error><record id="PMC3"/></OA>'
+    with patch("pmcgrab.oa_service.cached_get") as mock_get:
+        mock_get.return_value = SimpleNamespace(content=content)
+
+        assert oa_service.fetch("PMC3") == {"id": "PMC3"}
+
+
+def test_fetch_reuses_parsed_record_and_returns_copies():
+    with patch("pmcgrab.oa_service.cached_get") as mock_get:
+        mock_get.return_value = SimpleNamespace(content=_OA_RESPONSE)
+
+        first = oa_service.fetch("PMC7181753")
+        first["license"] = "mutated"
+        second = oa_service.fetch("PMC7181753")
+
+    assert mock_get.call_count == 1
+    assert second["license"] == "CC BY"
+    assert second is not first
+
+
+def test_fetch_does_not_expand_entities():
+    content = (
+        b'<!DOCTYPE OA [<!ENTITY x "expanded">]>'
+        b'<OA><records><record id="PMC1"><link>&x;</link></record></records></OA>'
+    )
+    with patch("pmcgrab.oa_service.cached_get") as mock_get:
+        mock_get.return_value = SimpleNamespace(content=content)
+
+        assert oa_service.fetch("PMC1") == {"id": "PMC1", "link": ""}
+
+
+def test_fetch_prefers_records_container_over_root_level_record():
+    content = (
+        b'<OA><record id="root"/><records><record id="PMC4"/></records>'
+        b'<record id="later"/></OA>'
+    )
+    with patch("pmcgrab.oa_service.cached_get") as mock_get:
+        mock_get.return_value = SimpleNamespace(content=content)
+
+        assert oa_service.fetch("PMC4") == {"id": "PMC4"}
+
+    empty = b'<OA><records></records><record id="root"/></OA>'
+    with patch("pmcgrab.oa_service.cached_get") as mock_get:
+        mock_get.return_value = SimpleNamespace(content=empty)
+
+        assert oa_service.fetch("PMC5") is None
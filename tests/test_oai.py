@@ -0,0 +1,272 @@
+from unittest.mock import patch
+
+import lxml.etree as ET
+import pytest
+import requests
+
+from pmcgrab import oai
+
+_NS = 'xmlns="http://www.openarchives.org/OAI/2.0/"'
+
+
+@pytest.fixture(autouse=True)
+def _no_rate_limit():
+    with patch("pmcgrab.oai.oai_rate_limit_wait") as wait:
+        yield wait
+
+
+class _FakeResponse:
+    def __init__(self, body: str) -> None:
+        self.content = body.encode()
+
+    def raise_for_status(self) -> None:
+        pass
+
+
+def _list_page(verb: str, items: str, token: str = "") -> str:
+    resumption = f"<resumptionToken>{token}</resumptionToken>" if token else ""
+    return f"<OAI-PMH {_NS}><{verb}>{items}{resumption}</{verb}></OAI-PMH>"
+
+
+def _record(pmcid: str) -> str:
+    return (
+        f"<record><header><identifier>oai:pmc:{pmcid}</identifier></header>"
+        f"<metadata><article/></metadata></record>"
+    )
+
+
+def test_list_records_parses_pages_and_follows_tokens():
+    pages = {
+        None: _list_page("ListRecords", _record("PMC1") + _record("PMC2"), "t1"),
+        "t1": _list_page("ListRecords", _record("PMC3"), ""),
+    }
+
+    def fake_get(_url, *, params, cache, **_kwargs):
+        assert not cache
+        return _FakeResponse(pages[params.get("resumptionToken")])
+
+    with patch("pmcgrab.oai.cached_get", side_effect=fake_get):
+        records = list(oai.list_records(from_="2024-01-01"))
+
+    assert [r.findtext("{*}header/{*}identifier") for r in records] == [
+        "oai:pmc:PMC1",
+        "oai:pmc:PMC2",
+        "oai:pmc:PMC3",
+    ]
+    # Yielded records are complete but no longer attached to their page.
+    assert all(r.find("{*}metadata") is not None for r in records)
+
+
+def test_list_records_retries_page_dropped_mid_body():
+    body = _list_page("ListRecords", _record("PMC1"))
+    with (
+        patch("pmcgrab.http_utils._session") as session,
+        patch("pmcgrab.http_utils._backoff_sleep"),
+    ):
+        session.get.side_effect = [
+            requests.exceptions.ChunkedEncodingError("connection dropped"),
+            _FakeResponse(body),
+        ]
+        records = list(oai.list_records())
+
+    assert [r.findtext("{*}header/{*}identifier") for r in records] == ["oai:pmc:PMC1"]
+    assert session.get.call_count == 2
+
+
+def test_list_identifiers_yields_identifier_text():
+    headers = "".join(
+        f"<header><identifier>oai:pmc:PMC{i}</identifier></header>" for i in (1, 2)
+    )
+    with patch("pmcgrab.oai.cached_get") as mock_get:
+        mock_get.return_value = _FakeResponse(_list_page("ListIdentifiers", headers))
+
+        assert list(oai.list_identifiers()) == ["oai:pmc:PMC1", "oai:pmc:PMC2"]
+
+
+def test_list_records_raises_protocol_errors():
+    body = f'<OAI-PMH {_NS}><error code="noRecordsMatch">none</error></OAI-PMH>'
+    with patch("pmcgrab.oai.cached_get") as mock_get:
+        mock_get.return_value = _FakeResponse(body)
+
+        with pytest.raises(oai.OAIPMHError, match="none"):
+            list(oai.list_records())
+
+
+def test_get_record_returns_record_element():
+    body = f"<OAI-PMH {_NS}><GetRecord>{_record('PMC7')}</GetRecord></OAI-PMH>"
+    with patch("pmcgrab.oai.cached_get") as mock_get:
+        mock_get.return_value = _FakeResponse(body)
+
+        record = oai.get_record("oai:pmc:PMC7")
+
+    assert record.findtext("{*}header/{*}identifier") == "oai:pmc:PMC7"
+    assert mock_get.call_args.kwargs["cache"] is True
+
+
+def test_list_records_prefetch_matches_streaming():
+    pages = {
+        None: _list_page("ListRecords", _record("PMC1"), "t&amp;1"),
+        "t&1": _list_page("ListRecords", _record("PMC2"), "t2"),
+        "t2": _list_page("ListRecords", _record("PMC3")),
+    }
+
+    def fake_get(_url, *, params, cache, **_kwargs):
+        assert not cache
+        return _FakeResponse(pages[params.get("resumptionToken")])
+
+    def identifiers(records):
+        return [r.findtext("{*}header/{*}identifier") for r in records]
+
+    with patch("pmcgrab.oai.cached_get", side_effect=fake_get):
+        streamed = identifiers(oai.list_records())
+        prefetched = identifiers(oai.list_records(prefetch=True))
+
+    assert streamed == prefetched == ["oai:pmc:PMC1", "oai:pmc:PMC2", "oai:pmc:PMC3"]
+
+
+def test_list_sets_reads_spec_and_name():
+    body = (
+        f"<OAI-PMH {_NS}><ListSets>"
+        "<set><setSpec>pmc-open</setSpec><setName>Open</setName></set>"
+        "<set><setSpec>empty</setSpec><setName/></set>"
+        "</ListSets></OAI-PMH>"
+    )
+    with patch("pmcgrab.oai.cached_get") as mock_get:
+        mock_get.return_value = _FakeResponse(body)
+
+        assert oai.list_sets() == [
+            {"setSpec": "pmc-open", "setName": "Open"},
+            {"setSpec": "empty", "setName": ""},
+        ]
+
+
+def test_gather_harvests_runs_each_harvest():
+    import asyncio
+
+    def fake_get(_url, *, params, **_kwargs):
+        pmcid = params.get("set", "PMC0")
+        return _FakeResponse(_list_page("ListRecords", _record(pmcid)))
+
+    with patch("pmcgrab.oai.cached_get", side_effect=fake_get):
+        results = asyncio.run(
+            oai.gather_harvests([{"set_": "PMC1"}, {"set_": "PMC2"}, {}])
+        )
+
+    assert [[r.findtext("{*}header/{*}identifier") for r in rs] for rs in results] == [
+        ["oai:pmc:PMC1"],
+        ["oai:pmc:PMC2"],
+        ["oai:pmc:PMC0"],
+    ]
+
+
+def test_list_records_resumes_from_checkpoint(tmp_path):
+    pages = {
+        None: _list_page("ListRecords", _record("PMC1"), "t1"),
+        "t1": _list_page("ListRecords", _record("PMC2")),
+    }
+    requested = []
+
+    def fake_get(_url, *, params, **_kwargs):
+        requested.append(params.get("resumptionToken"))
+        return _FakeResponse(pages[params.get("resumptionToken")])
+
+    checkpoint = tmp_path / "harvest.json"
+    with patch("pmcgrab.oai.cached_get", side_effect=fake_get):
+        harvest = oai.list_records(set_="s", checkpoint_path=checkpoint)
+        next(harvest)
+        assert not checkpoint.exists()
+        next(harvest, None)  # finishes page one, then fetches page two
+        assert '"token": "t1"' in checkpoint.read_text()
+        harvest.close()
+
+        requested.clear()
+        resumed = list(oai.list_records(set_="s", checkpoint_path=checkpoint))
+        assert requested == ["t1"]
+        assert len(resumed) == 1
+        assert not checkpoint.exists()
+
+        checkpoint.write_text('{"verb": "ListRecords", "params": {}, "token": "x"}')
+        with pytest.raises(ValueError, match="different harvest"):
+            list(oai.list_records(set_="s", checkpoint_path=checkpoint))
+
+
+def test_list_records_projection_yields_compact_records():
+    import pickle
+
+    record = (
+        "<record><header><identifier>oai:pmc:PMC9</identifier>"
+        "<datestamp>2024-05-01</datestamp><setSpec>a</setSpec><setSpec>b</setSpec>"
+        "</header><metadata><article>Body</article></metadata></record>"
+    )
+    with patch("pmcgrab.oai.cached_get") as mock_get:
+        mock_get.return_value = _FakeResponse(_list_page("ListRecords", record))
+
+        (projected,) = oai.list_records(project=oai.project_basic)
+
+    assert projected.identifier == "oai:pmc:PMC9"
+    assert projected.datestamp == "2024-05-01"
+    assert projected.set_specs == ("a", "b")
+    metadata = ET.fromstring(projected.metadata_xml)
+    assert metadata.findtext("{*}article") == "Body"
+    assert pickle.loads(pickle.dumps(projected)) == projected
+
+
+def test_list_records_parallel_yields_results_in_order():
+    pages = {
+        None: _list_page("ListRecords", _record("PMC1") + _record("PMC2"), "t1"),
+        "t1": _list_page("ListRecords", _record("PMC3") + _record("PMC4")),
+    }
+
+    def fake_get(_url, *, params, **_kwargs):
+        return _FakeResponse(pages[params.get("resumptionToken")])
+
+    with patch("pmcgrab.oai.cached_get", side_effect=fake_get):
+        # bytes.decode is picklable and needs no import in the worker.
+        results = list(oai.list_records_parallel(bytes.decode, workers=1))
+
+    assert [ET.fromstring(r).findtext("{*}header/{*}identifier") for r in results] == [
+        f"oai:pmc:PMC{i}" for i in range(1, 5)
+    ]
+
+
+def test_every_page_request_waits_for_rate_limiter(_no_rate_limit):
+    pages = {
+        None: _list_page("ListRecords", _record("PMC1"), "t1"),
+        "t1": _list_page("ListRecords", _record("PMC2")),
+    }
+
+    def fake_get(_url, *, params, **_kwargs):
+        return _FakeResponse(pages[params.get("resumptionToken")])
+
+    with patch("pmcgrab.http_utils._session") as session:
+        session.get.side_effect = fake_get
+        assert len(list(oai.list_records())) == 2
+
+    assert _no_rate_limit.call_count == 2
+
+
+def test_cached_responses_skip_rate_limiter(_no_rate_limit):
+    from pmcgrab.http_utils import _CACHE
+
+    _CACHE.clear()
+    body = f"<OAI-PMH {_NS}><GetRecord>{_record('PMC8')}</GetRecord></OAI-PMH>"
+    with patch("pmcgrab.http_utils._session") as session:
+        session.get.return_value = _FakeResponse(body)
+        oai.get_record("oai:pmc:PMC8")
+        oai.get_record("oai:pmc:PMC8")
+    _CACHE.clear()
+
+    assert session.get.call_count == 1
+    assert _no_rate_limit.call_count == 1
+
+
+def test_prefetch_reads_only_the_verb_level_resumption_token():
+    nested = (
+        "<record><header><identifier>oai:pmc:PMC1</identifier></header>"
+        "<metadata><resumptionToken>bogus</resumptionToken></metadata></record>"
+    )
+    page = _FakeResponse(_list_page("ListRecords", nested))
+    with patch("pmcgrab.oai.cached_get", side_effect=[page]) as mock_get:
+        assert len(list(oai.list_records(prefetch=True))) == 1
+
+    assert mock_get.call_count == 1
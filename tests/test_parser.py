@@ -1,9 +1,11 @@
 import datetime
+import warnings
 
 import lxml.etree as ET
 import pytest
 
 from pmcgrab import parser
+from pmcgrab.constants import UnmatchedCitationWarning
 from pmcgrab.model import TextParagraph, TextSection
 
 SAMPLE_XML = """<?xml version='1.0' encoding='utf-8'?>
@@ -124,3 +126,283 @@ def test_paper_dict_from_pmc_raises_acquisition_error_without_suppression(monkey
             validate=False,
             suppress_errors=False,
         )
+
+
+def test_warnings_suppressed_covers_per_call_parsing(monkeypatch):
+    def noisy_build(*args, **kwargs):
+        warnings.warn("noisy", UserWarning, stacklevel=1)
+        return {"ok": True}
+
+    monkeypatch.setattr(parser, "build_complete_paper_dict", noisy_build)
+    root = ET.fromstring(SAMPLE_XML.encode())
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        with parser.warnings_suppressed():
+            d = parser.generate_paper_dict(1, root, suppress_warnings=False)
+        assert not caught
+        parser.generate_paper_dict(1, root, suppress_warnings=False)
+
+    assert d == {"ok": True}
+    assert [str(w.message) for w in caught] == ["noisy"]
+
+
+_XREF_TARGETS_XML = b"""<article>
+  <body>
+    <sec id="s1"><title>Methods</title><p>Text</p></sec>
+    <disp-formula id="e1">E = mc2</disp-formula>
+    <boxed-text id="bx1"><p>Box</p></boxed-text>
+  </body>
+  <back>
+    <ref-list><ref id="r1"><mixed-citation>Smith 2020</mixed-citation></ref></ref-list>
+    <fn-group><fn id="fn1"><p>A footnote</p></fn></fn-group>
+  </back>
+</article>"""
+
+
+def test_process_reference_map_resolves_xref_targets_by_id():
+    from pmcgrab.domain.value_objects import BasicBiMap
+
+    root = ET.fromstring(_XREF_TARGETS_XML)
+    xrefs = [
+        ("bibr", "r1"),
+        ("fn", "fn1"),
+        ("sec", "s1"),
+        ("disp-formula", "e1"),
+        ("boxed-text", "bx1"),
+        ("fn", "missing"),
+    ]
+    ref_map = BasicBiMap(
+        {
+            i: f'<xref ref-type="{rtype}" rid="{rid}"/>'
+            for i, (rtype, rid) in enumerate(xrefs)
+        }
+    )
+
+    resolved = parser.process_reference_map(root, ref_map)
+
+    assert resolved[0] == "Smith 2020"
+    assert resolved[1] == "A footnote"
+    assert resolved[2] == {"type": "section", "id": "s1", "title": "Methods"}
+    assert resolved[3] == {"type": "formula", "id": "e1", "text": "E = mc2"}
+    assert resolved[4] == {"type": "boxed-text", "id": "bx1", "text": "Box"}
+    assert 5 not in resolved
+
+
+def test_id_index_keeps_first_element_per_tag_and_id():
+    root = ET.fromstring(
+        b'<article><fig id="x"><label>A</label></fig><!-- c -->'
+        b'<fig id="x"/><table-wrap id="x"/><sec id="y"/></article>'
+    )
+
+    index = parser._build_id_index(root)
+
+    assert index[("fig", "x")].findtext("label") == "A"
+    assert index[(None, "x")] is index[("fig", "x")]
+    assert index[("table-wrap", "x")].tag == "table-wrap"
+    assert ("fig", "y") not in index
+
+
+def test_process_reference_map_without_map_parses_every_ref():
+    resolved = parser.process_reference_map(ET.fromstring(_XREF_TARGETS_XML), None)
+
+    assert dict(resolved) == {0: "Smith 2020"}
+
+
+def test_process_reference_map_resolves_each_target_once(monkeypatch):
+    from pmcgrab.domain.value_objects import BasicBiMap
+
+    calls = []
+    parse_citation = parser._parse_citation
+    monkeypatch.setattr(
+        parser,
+        "_parse_citation",
+        lambda ref: calls.append(ref.get("id")) or parse_citation(ref),
+    )
+    ref_map = BasicBiMap(
+        {
+            0: '<xref ref-type="bibr" rid="r1">1</xref>',
+            1: '<xref ref-type="bibr" rid="r1">Smith 2020</xref>',
+            2: '<xref ref-type="bibr" rid="missing">2</xref>',
+        }
+    )
+
+    with pytest.warns(UnmatchedCitationWarning, match="Citation id not found"):
+        resolved = parser.process_reference_map(
+            ET.fromstring(_XREF_TARGETS_XML), ref_map
+        )
+
+    assert calls == ["r1"]
+    assert resolved[0] == resolved[1] == "Smith 2020"
+    assert 2 not in resolved
+
+
+def test_build_parses_each_back_reference_once(monkeypatch):
+    calls = []
+    parse_citation = parser._parse_citation
+    monkeypatch.setattr(
+        parser,
+        "_parse_citation",
+        lambda ref: calls.append(ref.get("id")) or parse_citation(ref),
+    )
+    root = ET.fromstring(
+        b'<article><body><sec><title>Intro</title><p>See <xref ref-type="bibr" '
+        b'rid="r1">1</xref>.</p></sec></body><back><ref-list>'
+        b'<ref id="r1"><mixed-citation>Smith 2020</mixed-citation></ref>'
+        b'<ref id="r2"><mixed-citation>Jones 2021</mixed-citation></ref>'
+        b"</ref-list></back></article>"
+    )
+
+    d = parser.build_complete_paper_dict(1, root, verbose=False)
+
+    assert calls == ["r1", "r2"]
+    assert [record["citation"] for record in d["All References"]] == [
+        "Smith 2020",
+        "Jones 2021",
+    ]
+
+
+_FRONT_BACK_XML = b"""<article xmlns:xlink="http://www.w3.org/1999/xlink">
+  <front><article-meta>
+    <title-group>
+      <article-title>Main</article-title><subtitle>Sub</subtitle>
+      <trans-title-group xml:lang="de">
+        <trans-title>Haupt</trans-title>
+      </trans-title-group>
+    </title-group>
+    <author-notes>
+      <corresp>Contact A</corresp>
+      <fn fn-type="con"><p>Equal work</p></fn>
+    </author-notes>
+    <self-uri xlink:href="a.pdf" content-type="pdf"/>
+    <related-article related-article-type="corrected-article" id="ra1"/>
+    <conference><conf-name>Conf</conf-name></conference>
+  </article-meta></front>
+  <back>
+    <app-group><app><title>A1</title><p>Extra</p></app></app-group>
+    <glossary><def-list><def-item><term>T</term><def><p>D</p></def></def-item>
+    </def-list></glossary>
+  </back>
+</article>"""
+
+
+def test_front_and_back_matter_gatherers():
+    root = ET.fromstring(_FRONT_BACK_XML)
+
+    assert parser.gather_subtitle(root) == "Sub"
+    assert parser.gather_translated_titles(root) == [{"lang": "de", "title": "Haupt"}]
+    assert parser.gather_author_notes(root) == {
+        "correspondence": ["Contact A"],
+        "footnotes": [{"type": "con", "text": "Equal work"}],
+    }
+    assert parser.gather_self_uri(root) == [{"href": "a.pdf", "content_type": "pdf"}]
+    assert parser.gather_related_articles(root)[0]["id"] == "ra1"
+    assert parser.gather_conference_info(root)["conf_name"] == "Conf"
+    assert parser.gather_appendices(root) == [{"title": "A1", "text": "Extra"}]
+    assert parser.gather_glossary(root) == [{"term": "T", "definition": "D"}]
+
+
+def test_ref_map_with_tags_is_an_independent_snapshot():
+    root = ET.fromstring(
+        b"<article><body><sec><title>Intro</title><p>As shown "
+        b'<xref ref-type="bibr" rid="r1">1</xref>.</p></sec></body>'
+        b'<back><ref-list><ref id="r1"><mixed-citation>Smith 2020</mixed-citation>'
+        b"</ref></ref-list></back></article>"
+    )
+
+    d = parser.build_complete_paper_dict(1, root, include_ref_map_with_tags=True)
+    tags = d["Ref Map With Tags"]
+
+    assert list(tags.values()) == ['<xref ref-type="bibr" rid="r1">1</xref>']
+    assert tags.reverse == {tags[0]: 0}
+    assert d["Ref Map"][0] == "Smith 2020"
+    assert not parser.build_complete_paper_dict(1, root)["Ref Map With Tags"]
+
+
+def test_resolved_reference_lists_follow_map_order():
+    from pmcgrab.domain.value_objects import BasicBiMap
+
+    root = ET.fromstring(_XREF_TARGETS_XML)
+    ref_map = BasicBiMap(
+        {
+            0: '<xref ref-type="bibr" rid="r1"/>',
+            1: '<xref ref-type="sec" rid="s1"/>',
+            2: "<fig id='f1'><caption><p>Figure</p></caption></fig>",
+        }
+    )
+
+    resolved, citations, tables, figures = parser._resolve_reference_map(root, ref_map)
+
+    assert citations == [resolved[0], resolved[1]]
+    assert citations[0] == "Smith 2020"
+    assert tables == []
+    assert figures == [resolved[2].fig_dict]
+    assert figures[0]["Caption"] == "Figure"
+
+
+def test_parse_citation_reads_first_of_each_field():
+    ref = ET.fromstring(
+        b'<ref id="b1"><element-citation publication-type="journal">'
+        b'<person-group person-group-type="author">'
+        b"<name><surname>Doe</surname><given-names>J</given-names></name>"
+        b"<name><surname>Roe</surname></name><collab>Team</collab><etal/>"
+        b"</person-group><article-title>Title</article-title><source>Src</source>"
+        b"<year>2020</year><fpage>1</fpage><lpage>9</lpage>"
+        b'<pub-id pub-id-type="pmid">123</pub-id>'
+        b'<pub-id pub-id-type="doi">10.1/a</pub-id>'
+        b'<pub-id pub-id-type="doi">10.1/b</pub-id>'
+        b"</element-citation></ref>"
+    )
+
+    citation = parser._parse_citation(ref)
+
+    assert citation["authors"] == ["J Doe", "Roe", "Team"]
+    assert citation["has_etal"] is True
+    assert citation["publication_type"] == "journal"
+    assert (citation["title"], citation["source"], citation["year"]) == (
+        "Title",
+        "Src",
+        "2020",
+    )
+    assert (citation["first_page"], citation["last_page"]) == ("1", "9")
+    assert (citation["doi"], citation["pmid"], citation["pmcid"]) == (
+        "10.1/a",
+        "123",
+        None,
+    )
+    assert "mixed_citation_text" not in citation
+
+
+def test_parse_citation_collects_editor_groups_and_ext_links_in_order():
+    ref = ET.fromstring(
+        b'<ref id="b2" xmlns:xlink="http://www.w3.org/1999/xlink">'
+        b'<element-citation publication-type="book">'
+        b'<person-group person-group-type="editor">'
+        b"<name><surname>Ed</surname><given-names>A</given-names></name>"
+        b"</person-group>"
+        b'<person-group person-group-type="author"><name><surname>Au</surname>'
+        b"</name></person-group>"
+        b'<person-group person-group-type="editor"><name><surname>Ed2</surname>'
+        b'</name></person-group><ext-link xlink:href="https://a"/>'
+        b'<comment><ext-link xlink:href="https://b"/></comment>'
+        b"</element-citation></ref>"
+    )
+
+    citation = parser._parse_citation(ref)
+
+    assert citation["authors"] == ["Au"]
+    assert citation["editors"] == ["A Ed", "Ed2"]
+    assert citation["ext_links"] == ["https://a", "https://b"]
+
+
+def test_targets_resolved_checks_ids_found_anywhere_in_document():
+    root = ET.fromstring(
+        b'<article><front><fn id="n1"/></front><body><fig id="f\'1"/></body></article>'
+    )
+    body = root.find("body")
+    document_ids = parser._document_ids(body)
+
+    assert document_ids == {"n1", "f'1"}
+    assert parser._targets_resolved("figure", ["f'1", "n1"], set(), document_ids)
+    assert not parser._targets_resolved("figure", ["f'1", "f2"], set(), document_ids)
+    assert parser._targets_resolved("citation", ["r1"], {"r1"}, document_ids)
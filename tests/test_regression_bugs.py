@@ -284,6 +284,7 @@ class TestListInParagraph:
         text = str(para)
         assert "Plain text with" in text
         assert "bold" in text
+        assert _flatten_block_elements_in_paragraph(p_elem) is p_elem
 
 
 # ---------------------------------------------------------------------------
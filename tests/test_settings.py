@@ -35,3 +35,22 @@ def test_ssl_verification_can_be_explicitly_disabled(monkeypatch):
 
     monkeypatch.delenv("PMCGRAB_SSL_VERIFY", raising=False)
     importlib.reload(importlib.import_module("pmcgrab.infrastructure.settings"))
+
+
+def test_invalid_oai_rate_falls_back_to_default(monkeypatch):
+    monkeypatch.delenv("NCBI_API_KEY", raising=False)
+    for value in ("0", "-2", "fast"):
+        monkeypatch.setenv("PMCGRAB_OAI_RPS", value)
+        settings = importlib.reload(
+            importlib.import_module("pmcgrab.infrastructure.settings")
+        )
+        assert settings.PMCGRAB_OAI_RPS == 3.0
+
+    monkeypatch.setenv("PMCGRAB_OAI_RPS", "1.5")
+    settings = importlib.reload(
+        importlib.import_module("pmcgrab.infrastructure.settings")
+    )
+    assert settings.PMCGRAB_OAI_RPS == 1.5
+
+    monkeypatch.delenv("PMCGRAB_OAI_RPS", raising=False)
+    importlib.reload(importlib.import_module("pmcgrab.infrastructure.settings"))
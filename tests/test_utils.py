@@ -12,8 +12,10 @@ from pmcgrab.common.xml_processing import (
     remove_mhtml_tags,
     split_text_and_refs,
     stringify_children,
+    text_content,
 )
 from pmcgrab.domain.value_objects import BasicBiMap
+from pmcgrab.utils import define_data_dict
 
 
 class TestUtilsFunctions:
@@ -103,6 +105,13 @@ class TestUtilsFunctions:
 
         assert result == ""
 
+    def test_text_content_matches_itertext(self):
+        """Test text_content joins descendant text, skipping comments and tail."""
+        xml = "<t> Gene <italic>BRCA1</italic><!-- note --> and\ncancer </t>tail"
+        element = ET.fromstring(f"<root>{xml}</root>")[0]
+        assert text_content(element) == "".join(element.itertext()).strip()
+        assert text_content(element) == "Gene BRCA1 and\ncancer"
+
     def test_split_text_and_refs_no_refs(self):
         """Test split_text_and_refs without references."""
         xml_text = "<p>Simple text without references</p>"
@@ -198,6 +207,16 @@ class TestUtilsFunctions:
         assert "demonstrates" in result
         assert "findings" in result
 
+    def test_define_data_dict_returns_independent_copies(self):
+        """Test callers can modify the data dict without affecting later calls."""
+        first = define_data_dict()
+        first["Title"] = "changed"
+        first["Extra"] = "added"
+
+        second = define_data_dict()
+        assert second["Title"] == "Title of the PMC article."
+        assert "Extra" not in second
+
 
 class TestBasicBiMapInUtils:
     """Test BasicBiMap functionality in utils context."""